@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+
+import subprocess
+import platform
+import argparse
+import json
+import time
+import sys
+
+import pymunk
+import numpy
+
+from .suite import BENCHMARKS, SEED, runBenchmark
+
+def gitRevision():
+
+    try:
+        return subprocess.run(
+            ('git', 'rev-parse', 'HEAD'), capture_output=True, text=True,
+            check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def loadBaseline(filename):
+
+    with open(filename) as file:
+        content = json.load(file)
+
+    return {result['name']: result for result in content['benchmarks']}
+
+def main():
+
+    parser = argparse.ArgumentParser(
+        description='Run the simulation benchmarks headless from a fixed seed')
+
+    parser.add_argument(
+        '-o', '--output', default=None,
+        help='Name of the file where the results are written as JSON'
+    )
+    parser.add_argument(
+        '-k', '--filter', dest='filters', action='append', default=[],
+        help=('Only run benchmarks whose name contains this text, can be '
+              'used multiple times')
+    )
+    parser.add_argument(
+        '-r', '--repeat', type=int, default=None,
+        help='Number of repeats of every benchmark, overrides the defaults'
+    )
+    parser.add_argument(
+        '-c', '--compare', default=None,
+        help='Results file of a previous run to compare the timings with'
+    )
+    parser.add_argument(
+        '--list', action='store_true', help='List the benchmarks and exit'
+    )
+
+    args = parser.parse_args()
+
+    benchmarks = [bench for bench in BENCHMARKS
+                  if not args.filters or
+                  any(text in bench.name for text in args.filters)]
+
+    if args.list:
+        for bench in benchmarks:
+            print(bench.name)
+        return
+
+    baseline = loadBaseline(args.compare) if args.compare else {}
+
+    results = []
+    for bench in benchmarks:
+
+        result = runBenchmark(bench, args.repeat)
+        results.append(result)
+
+        line = '{name}: min {min:.6f}s, median {median:.6f}s'.format(
+            **result)
+
+        if result['metrics']:
+            line += ', ' + ', '.join(
+                f'{name} {value}' for name, value in result['metrics'].items())
+
+        base_result = baseline.get(bench.name)
+        if base_result is not None:
+            line += ', {:.2f}x baseline'.format(
+                result['min']/base_result['min'])
+
+        print(line, flush=True)
+
+    output = {
+        'metadata': {
+            'revision': gitRevision(),
+            'timestamp': time.time(),
+            'seed': SEED,
+            'python': sys.version,
+            'platform': platform.platform(),
+            'pymunk': pymunk.version,
+            'numpy': numpy.__version__
+        },
+        'benchmarks': results
+    }
+
+    if args.output is not None:
+        with open(args.output, 'w') as file:
+            json.dump(output, file, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,240 @@
+from collections import namedtuple
+import tempfile
+import random
+import time
+import os
+
+from simplelifesimulation.config import loadCreatureConfig
+from simplelifesimulation.simulation.simulation import Simulation
+from simplelifesimulation.creatures.species import Species
+from simplelifesimulation.creatures.store import CreatureStore
+from simplelifesimulation.creatures.materials.material import MaterialsGroup
+
+SEED = 20200101
+
+Benchmark = namedtuple('Benchmark', ('name', 'params', 'factory', 'repeat'))
+
+BENCHMARKS = []
+
+STEP_SCALES = {
+    'small': {'population_size': 16, 'starting_resources': 20, 'size': 1000},
+    'medium': {'population_size': 120, 'starting_resources': 80,
+               'size': 2000},
+    'large': {'population_size': 500, 'starting_resources': 300,
+              'size': 5000}
+}
+
+__creature_configs = {}
+
+def creatureConfig(vision='polygon'):
+
+    config = __creature_configs.get(vision)
+    if config is None:
+        config = __creature_configs[vision] = loadCreatureConfig(
+            vision=vision)
+
+    return config
+
+def newSimulation(vision='polygon', **kwargs):
+
+    creature_config, initial_materials = creatureConfig(vision)
+
+    simulation_kwargs = {
+        'use_graphic': False, 'quiet': True, 'seed': SEED,
+        'creature_config': creature_config,
+        'creature_materials_start': initial_materials
+    }
+    simulation_kwargs.update(kwargs)
+
+    return Simulation(**simulation_kwargs)
+
+def benchmark(name, repeat=5, **params):
+
+    def register(factory):
+        BENCHMARKS.append(Benchmark(name, params, factory, repeat))
+        return factory
+
+    return register
+
+def runBenchmark(bench, repeat=None):
+
+    times = []
+    operations = 0
+    metrics = None
+
+    for _ in range(repeat or bench.repeat):
+
+        run, operations = bench.factory(**bench.params)
+
+        start = time.perf_counter()
+        metrics = run()
+        times.append(time.perf_counter() - start)
+
+    times.sort()
+
+    return {
+        'name': bench.name,
+        'params': bench.params,
+        'repeat': len(times),
+        'operations': operations,
+        'times': times,
+        'min': times[0],
+        'median': times[len(times)//2],
+        'mean': sum(times)/len(times),
+        'per_operation': times[0]/operations if operations else None,
+        'metrics': metrics
+    }
+
+def __stepFactory(scale, ticks, vision='polygon'):
+
+    simulation = newSimulation(vision, **STEP_SCALES[scale])
+
+    for _ in range(5):
+        simulation.step()
+
+    def run():
+        for _ in range(ticks):
+            simulation.step()
+
+    return run, ticks
+
+for __scale, __ticks in (('small', 200), ('medium', 50), ('large', 10)):
+    benchmark(f'simulation_step[{__scale}]', scale=__scale,
+              ticks=__ticks)(__stepFactory)
+    benchmark(f'simulation_step[{__scale},grid]', scale=__scale,
+              ticks=__ticks, vision='grid')(__stepFactory)
+
+@benchmark('creature_act', population=100)
+def creatureAct(population):
+
+    simulation = newSimulation(population_size=population,
+                               starting_resources=40)
+    creatures = simulation.creatures.snapshot()
+
+    def run():
+        for creature in creatures:
+            if not creature.destroyed:
+                creature.act(simulation)
+
+    return run, len(creatures)
+
+@benchmark('convertion_rule_convert', iterations=2000)
+def convertionRuleConvert(iterations):
+
+    creature_config, initial_materials = creatureConfig()
+
+    rules = creature_config.material_rules
+    materials = MaterialsGroup(initial_materials, creature_config.materials)
+    structure = materials.structure
+
+    def run():
+        for _ in range(iterations):
+            for rule in rules:
+                rule.convert(structure, materials, 1)
+
+    return run, iterations*len(rules)
+
+@benchmark('materials_group_properties[store]', iterations=20000,
+           backing='store')
+@benchmark('materials_group_properties', iterations=20000)
+def materialsGroupProperties(iterations, backing='dict'):
+
+    creature_config, initial_materials = creatureConfig()
+
+    if backing == 'store':
+        store = CreatureStore(creature_config)
+        slot = store.allocate(None)
+        store.setMaterials(slot, initial_materials)
+        materials = MaterialsGroup(store.materialsView(slot),
+                                   creature_config.materials, copy=False)
+    else:
+        materials = MaterialsGroup(initial_materials,
+                                   creature_config.materials)
+
+    material, quantity = next(iter(initial_materials.items()))
+
+    def run():
+        for _ in range(iterations):
+            materials[material] = quantity
+            materials.mass # pylint: disable=pointless-statement
+            materials.radius # pylint: disable=pointless-statement
+            materials.energy # pylint: disable=pointless-statement
+
+    return run, iterations
+
+@benchmark('species_get_child_species', iterations=2000)
+def speciesGetChildSpecies(iterations):
+
+    schema = creatureConfig()[0].trait_schema
+    rng = random.Random(SEED)
+
+    parent_traits = tuple(trait.random(rng) for trait in schema.traits)
+    parent = Species(schema.vectorToDict(parent_traits))
+
+    children_traits = [
+        schema.vectorToDict(tuple(
+            trait.mutate(value, rng)
+            for trait, value in zip(schema.traits, parent_traits)))
+        for _ in range(iterations)
+    ]
+
+    def run():
+        for traits in children_traits:
+            parent.getChildSpecies(schema.traits, traits)
+
+    return run, iterations
+
+def __wasteDepositFactory(radius, deposits, ticks):
+
+    simulation = newSimulation(population_size=50, starting_resources=200,
+                               size=2000, waste_deposit_radius=radius)
+
+    rng = random.Random(SEED)
+    positions = [(rng.uniform(0, 2000), rng.uniform(0, 2000))
+                 for _ in range(deposits)]
+
+    def run():
+
+        for x, y in positions:
+            simulation.depositWaste(x, y, 1000)
+
+        for _ in range(ticks):
+            simulation.step()
+
+        return {'plants': simulation.summary()['plants']}
+
+    return run, deposits
+
+for __radius in (0, 50, 150):
+    benchmark(f'waste_deposit[{__radius}]', repeat=3, radius=__radius,
+              deposits=2000, ticks=20)(__wasteDepositFactory)
+
+def __saveFile(population, resources):
+
+    path = os.path.join(tempfile.gettempdir(),
+                        f'simplelifesimulation-bench-{population}.json')
+
+    newSimulation(population_size=population, starting_resources=resources,
+                  out_file=path).save()
+
+    return path
+
+@benchmark('simulation_save', population=300, resources=200)
+def simulationSave(population, resources):
+
+    simulation = newSimulation(
+        population_size=population, starting_resources=resources,
+        out_file=os.path.join(tempfile.gettempdir(),
+                              'simplelifesimulation-bench-save.json'))
+
+    return simulation.save, population + resources
+
+@benchmark('simulation_load', population=300, resources=200)
+def simulationLoad(population, resources):
+
+    path = __saveFile(population, resources)
+
+    def run():
+        newSimulation(in_file=path)
+
+    return run, population + resources
@@ -8,7 +8,7 @@ DIR_PATH = os.path.abspath(os.path.dirname(__file__))
 with open(f'{DIR_PATH}/requirements.txt') as file:
     requirements = list(file)
 
-packages = find_packages()
+packages = find_packages(exclude=('benchmarks',))
 
 packages.append('simplelifesimulation.data')
 
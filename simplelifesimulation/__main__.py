@@ -1,73 +1,20 @@
 #!/usr/bin/env python3
 
-from pathlib import Path
-import json
 import os
 
 import argparse
 
 from .simulation.simulation import Simulation
+from .simulation.scheduler import PhaseScheduler
+from .simulation.sharding import ShardedSimulation
+from .simulation.stats import PhaseStats
+from .simulation.trace import Tracer
 
-from .creatures.creature import Creature
-from .creatures.materials.rule import loadConvertionRules
-from .creatures.materials.material import loadMaterials
-from .creatures.traits import getCreatureTraits
-
-def interval_integer_min_limit(arg_name, min_, arg):
-
-    values = arg.split('-')
-
-    if len(values) > 2:
-        raise argparse.ArgumentTypeError(
-            "%s cannot contain more than one '-' character" % arg_name)
-
-    if len(values) == 2:
-
-        min_ = integer_min_limit(arg_name + '(min value)', min_, values[0])
-        max_ = integer_min_limit(arg_name + '(max value)', min_, values[1])
-        if min_ > max_:
-            raise argparse.ArgumentTypeError(
-                "%s min value must be lower than max value" % arg_name)
-
-        return min_, max_
-
-    return integer_min_limit(arg_name, min_, arg)
-
-def integer_min_limit(arg_name, min_, x):
-
-    try:
-        x = int(x)
-    except ValueError:
-        raise argparse.ArgumentTypeError("%s must be an integer" % arg_name)
-
-    if x < min_:
-        raise argparse.ArgumentTypeError(
-            "%s must be higher or equal to %d" % (arg_name, min_))
-
-    return x
-
-def interval_integer(arg_name, min_, max_, x):
-
-    x = integer_min_limit(arg_name, min_, x)
-
-    if x > max_:
-        raise argparse.ArgumentTypeError(
-            "%s must be lower or equal to %d" % (arg_name, max_))
-
-    return x
-
-def real_min_limit(arg_name, min_, x):
-
-    try:
-        x = float(x)
-    except ValueError:
-        raise argparse.ArgumentTypeError("%s must be a number" % arg_name)
-
-    if x < min_:
-        raise argparse.ArgumentTypeError(
-            "%s must be higher or equal to %d" % (arg_name, min_))
-
-    return x
+from .config import loadCreatureConfig
+from .cli_types import (
+    interval_integer_min_limit, integer_min_limit, real_min_limit,
+    phase_period
+)
 
 def main():
 
@@ -163,92 +110,237 @@ def main():
         '--energy-consume-multiplier', default=1, type=float,
         help='Creature energy consume multiplier'
     )
+    parser.add_argument(
+        '--max-ticks',
+        type=lambda x : integer_min_limit('Maximum ticks', 1, x),
+        default=None,
+        help='Stop after this many ticks when running without graphics'
+    )
+    parser.add_argument(
+        '--max-time',
+        type=lambda x : real_min_limit('Maximum time', 0, x),
+        default=None,
+        help='Stop after this many seconds when running without graphics'
+    )
+    parser.add_argument(
+        '--report-interval',
+        type=lambda x : integer_min_limit('Report interval', 0, x),
+        default=1000,
+        help=('Number of ticks between progress reports when running '
+              'without graphics, 0 disables periodic reports')
+    )
+    parser.add_argument(
+        '--report-file', default=None,
+        help='Name of the file where progress reports are written as JSON'
+    )
+    parser.add_argument(
+        '--phase-period', dest='phase_periods', action='append',
+        type=phase_period, default=[],
+        help=('Run a simulation phase only every PERIOD ticks, in the format '
+              'PHASE=PERIOD, can be used multiple times. Phases: ' +
+              ', '.join(PhaseScheduler.PHASES))
+    )
+    parser.add_argument(
+        '--no-vectorized-convertion', dest='vectorized_convertion',
+        action='store_false',
+        help=('Apply material convertion rules creature by creature instead '
+              'of for the whole population at once')
+    )
 
-    args = parser.parse_args()
-
-    if args.screen_width is not None or args.screen_height is not None:
-        screen_size = (args.screen_width or 600, args.screen_height or 600)
-    else:
-        screen_size = None
+    parser.add_argument(
+        '--vision', choices=('polygon', 'circle', 'grid'), default='polygon',
+        help=('How creatures see, polygon uses pymunk sensor polygons, circle '
+              'a circle sensor filtered by the vision angle and grid answers '
+              'vision queries through a spatial hash')
+    )
 
-    creature_config_kwargs = {
-        'energy_consume_multiplier': args.energy_consume_multiplier
-    }
+    parser.add_argument(
+        '--sensing-period',
+        type=lambda x : integer_min_limit('Sensing period', 1, x),
+        default=1,
+        help=('Number of ticks between two vision scans of a creature, scans '
+              'are spread across ticks by creature id')
+    )
 
-    material_rules_config_file = args.material_rules_config
-    materials_config_file = args.materials_config
-    materials_quantity_file = args.materials_quantity
+    parser.add_argument(
+        '--grid-plant-merge', action='store_true',
+        help=('Merge overlapping plants in a periodic pass over a spatial '
+              'grid instead of on contact, the pass runs every plant_merge '
+              'phase period')
+    )
 
-    config_dir = args.config
+    parser.add_argument(
+        '--waste-deposit-radius',
+        type=lambda x : real_min_limit('Waste deposit radius', 0, x),
+        default=0,
+        help=('Creatures excrete waste into the nearest plant within this '
+              'distance and only create a new plant when there is none, 0 '
+              'always creates a new plant')
+    )
 
-    if config_dir is None:
+    parser.add_argument(
+        '--meat-merge-distance',
+        type=lambda x : real_min_limit('Meat merge distance', 0, x),
+        default=None,
+        help=('Coalesce meats whose borders are closer than this distance '
+              'into the largest one, the pass runs every meat_merge phase '
+              'period, disabled by default')
+    )
 
-        current_file_path = Path(__file__)
-        config_dir = current_file_path.parent.joinpath('data')
+    parser.add_argument(
+        '--shards',
+        type=lambda x : integer_min_limit('Number of shards', 1, x),
+        default=1,
+        help=('Split the world in this many vertical tiles, each one '
+              'simulated by its own process, requires --no-graphic. '
+              'Entities near a seam are mirrored to the neighbour tile: '
+              'they are seen and collided with there, but plants and '
+              'meats are only eaten or merged inside their own tile')
+    )
 
-        if not config_dir.exists():
-            config_dir = current_file_path.parents[1].joinpath('data')
+    parser.add_argument(
+        '--halo-width',
+        type=lambda x : real_min_limit('Halo width', 0, x),
+        default=100,
+        help=('Distance from a tile border where entities are copied to the '
+              'neighbour tile so they can be seen and collided with')
+    )
 
-    config_dir = Path(config_dir)
+    parser.add_argument(
+        '--exchange-period',
+        type=lambda x : integer_min_limit('Exchange period', 1, x),
+        default=5,
+        help=('Number of ticks between two exchanges of migrating entities '
+              'and halo copies between tiles')
+    )
 
-    if material_rules_config_file is None:
-        material_rules_config_file = config_dir.joinpath(
-            'material_convertion_rules.json')
+    parser.add_argument(
+        '--seed', type=int, default=None,
+        help=('Seed of the simulation random number generator, runs with '
+              'the same seed and arguments follow the same trajectory')
+    )
 
-    if materials_config_file is None:
-        materials_config_file = config_dir.joinpath('materials.json')
+    parser.add_argument(
+        '--stats', action='store_true',
+        help=('Time every simulation phase and count collision callbacks, '
+              'the averages are added to the progress reports')
+    )
 
-    if materials_quantity_file is None:
-        materials_quantity_file = config_dir.joinpath(
-            'materials_initial_quantity.json')
+    parser.add_argument(
+        '--stats-window',
+        type=lambda x : integer_min_limit('Stats window', 1, x),
+        default=PhaseStats.DEFAULT_WINDOW,
+        help='Number of ticks of the rolling averages of --stats'
+    )
 
-    materials_all = \
-        loadMaterials(materials_config_file)
+    parser.add_argument(
+        '--stats-pairs',
+        type=lambda x : integer_min_limit('Stats pairs', 0, x),
+        default=0,
+        help=('Number of the most active colliding pairs reported by '
+              '--stats within the window')
+    )
 
-    materials = materials_all.materials
+    parser.add_argument(
+        '--trace-file', default=None,
+        help=('Name of the file where the tick phases and notable events are '
+              'written in the Chrome trace event format')
+    )
 
-    creature_config_kwargs['materials'] = materials_all
+    parser.add_argument(
+        '--trace-buffer',
+        type=lambda x : integer_min_limit('Trace buffer', 1, x),
+        default=Tracer.DEFAULT_BUFFER_SIZE,
+        help='Number of trace events kept in memory before writing them'
+    )
 
-    if material_rules_config_file is None:
-        material_rules_config_file = base_file_path.joinpath(
-            'material_convertion_rules.json')
+    parser.add_argument(
+        '--trace-burst',
+        type=lambda x : integer_min_limit('Trace burst', 1, x),
+        default=Tracer.DEFAULT_BURST_SIZE,
+        help=('Number of births or deaths in a single tick traced as a '
+              'birth burst or mass death event')
+    )
 
-    convertion_rules = loadConvertionRules(
-        material_rules_config_file, materials)
-    creature_config_kwargs['material_rules'] = convertion_rules
+    args = parser.parse_args()
 
-    st_materials_mult = args.starting_materials_multiplier
+    if args.screen_width is not None or args.screen_height is not None:
+        screen_size = (args.screen_width or 600, args.screen_height or 600)
+    else:
+        screen_size = None
 
-    with open(materials_quantity_file) as file:
-        materials_qtd_file_content = json.load(file)
+    config_kwargs = {
+        'config_dir': args.config,
+        'materials_config': args.materials_config,
+        'material_rules_config': args.material_rules_config,
+        'materials_quantity': args.materials_quantity,
+        'starting_materials_multiplier': args.starting_materials_multiplier,
+        'energy_consume_multiplier': args.energy_consume_multiplier,
+        'vision': args.vision
+    }
 
-    initial_materials = {
-        material: materials_qtd_file_content.get(
-            material.name, 0)*st_materials_mult
-        for material in materials.values()
+    simulation_kwargs = {
+        'population_size': args.pop_size,
+        'starting_resources': args.resources_qtd,
+        'size': args.size, 'out_file': args.out_file,
+        'screen_size': screen_size, 'in_file': args.in_file,
+        'quiet': args.quiet, 'use_wall': args.use_wall,
+        'resource_convert_interval': args.plant_grow_interval,
+        'vectorized_convertion': args.vectorized_convertion,
+        'phase_periods': dict(args.phase_periods),
+        'sensing_period': args.sensing_period,
+        'grid_plant_merge': args.grid_plant_merge,
+        'waste_deposit_radius': args.waste_deposit_radius,
+        'meat_merge_distance': args.meat_merge_distance,
+        'seed': args.seed
     }
 
-    creature_config_kwargs['traits'] = getCreatureTraits(
-        materials, materials_all.energy_materials,
-        materials_all.waste_materials, convertion_rules, initial_materials)
-
-    creature_config = None
-    if creature_config_kwargs:
-        creature_config = Creature.Config(**creature_config_kwargs)
-
-    game = Simulation(population_size=args.pop_size,
-                      ticks_per_second=args.simulation_speed,
-                      starting_resources=args.resources_qtd,
-                      size=args.size, out_file=args.out_file,
-                      screen_size=screen_size,
-                      in_file=args.in_file, use_graphic=args.use_graphic,
-                      quiet=args.quiet, creature_config=creature_config,
+    if args.shards > 1:
+
+        if args.use_graphic:
+            parser.error('--shards requires --no-graphic')
+
+        if args.stats:
+            parser.error('--stats is not supported with --shards')
+
+        if args.trace_file is not None:
+            parser.error('--trace-file is not supported with --shards')
+
+        game = ShardedSimulation(shards=args.shards,
+                                 halo_width=args.halo_width,
+                                 exchange_period=args.exchange_period,
+                                 config=config_kwargs, **simulation_kwargs)
+        try:
+            game.run(max_ticks=args.max_ticks, max_time=args.max_time,
+                     report_interval=args.report_interval,
+                     report_file=args.report_file)
+        finally:
+            game.close()
+
+        return
+
+    creature_config, initial_materials = loadCreatureConfig(**config_kwargs)
+
+    game = Simulation(ticks_per_second=args.simulation_speed,
+                      use_graphic=args.use_graphic,
+                      creature_config=creature_config,
                       creature_materials_start=initial_materials,
-                      use_wall=args.use_wall,
-                      resource_convert_interval=args.plant_grow_interval,
                       user_interface=(f'.interface.{args.graphic_interface}',
-                                      'simplelifesimulation'))
-    game.run()
+                                      'simplelifesimulation'),
+                      **simulation_kwargs)
+
+    if args.stats:
+        game.enableStats(args.stats_window, args.stats_pairs)
+
+    if args.trace_file is not None:
+        game.enableTrace(args.trace_file, args.trace_buffer, args.trace_burst)
+
+    try:
+        game.run(max_ticks=args.max_ticks, max_time=args.max_time,
+                 report_interval=args.report_interval,
+                 report_file=args.report_file)
+    finally:
+        game.disableTrace()
 
 if __name__ == '__main__':
     main()
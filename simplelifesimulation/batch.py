@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+
+from collections import namedtuple
+from contextlib import redirect_stdout
+import multiprocessing
+import argparse
+import json
+import time
+import os
+
+from .simulation.simulation import Simulation
+from .config import loadCreatureConfig
+from .cli_types import integer_min_limit, interval_integer_min_limit
+
+BatchRun = namedtuple('BatchRun', ('name', 'seed', 'max_ticks', 'max_time',
+                                   'out_file', 'report_file', 'config',
+                                   'simulation'))
+BatchRun.__new__.__defaults__ = (None, None, None, None, None, None, None,
+                                 None)
+
+def loadBatchRuns(runs_info, seeds=None):
+
+    runs = []
+
+    for i, run_info in enumerate(runs_info or ({},)):
+
+        name = run_info.get('name', f'run{i}')
+
+        run_seeds = seeds
+        if run_seeds is None:
+            run_seeds = (run_info.get('seed'),)
+
+        for seed in run_seeds:
+
+            run_name = name if seeds is None else f'{name}-{seed}'
+            out_file = run_info.get('out_file')
+            report_file = run_info.get('report_file')
+
+            runs.append(BatchRun(
+                name=run_name, seed=seed,
+                max_ticks=run_info.get('max_ticks'),
+                max_time=run_info.get('max_time'),
+                out_file=None if out_file is None else out_file.format(
+                    name=run_name, seed=seed),
+                report_file=None if report_file is None else
+                report_file.format(name=run_name, seed=seed),
+                config=run_info.get('config'),
+                simulation=run_info.get('simulation')))
+
+    return runs
+
+def __runSimulation(args):
+
+    base_config, base_simulation, run = args
+
+    result = {'name': run.name, 'seed': run.seed, 'pid': os.getpid()}
+
+    start_time = time.perf_counter()
+
+    try:
+        creature_config, initial_materials = loadCreatureConfig(
+            **{**base_config, **(run.config or {})})
+
+        simulation_kwargs = {'quiet': True, 'report_interval': 0,
+                             'seed': run.seed}
+        simulation_kwargs.update(base_simulation)
+        simulation_kwargs.update(run.simulation or {})
+
+        report_interval = simulation_kwargs.pop('report_interval')
+
+        simulation = Simulation(
+            out_file=run.out_file, use_graphic=False,
+            creature_config=creature_config,
+            creature_materials_start=initial_materials,
+            **simulation_kwargs)
+
+        with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+            result.update(simulation.run(
+                max_ticks=run.max_ticks, max_time=run.max_time,
+                report_interval=report_interval,
+                report_file=run.report_file))
+
+    except Exception as error: # pylint: disable=broad-except
+        result['error'] = repr(error)
+
+    result['elapsed'] = time.perf_counter() - start_time
+    result['out_file'] = run.out_file
+    result.pop('final', None)
+
+    return result
+
+def runBatch(runs, config=None, simulation=None, processes=None,
+             results_file=None):
+
+    tasks = [(config or {}, simulation or {}, run) for run in runs]
+
+    results_output = None
+    if results_file is not None:
+        results_output = open(results_file, 'w')
+
+    try:
+        with multiprocessing.Pool(processes, maxtasksperchild=1) as pool:
+            for result in pool.imap_unordered(__runSimulation, tasks):
+
+                if results_output is not None:
+                    results_output.write(json.dumps(result) + '\n')
+                    results_output.flush()
+
+                yield result
+    finally:
+        if results_output is not None:
+            results_output.close()
+
+def main():
+
+    parser = argparse.ArgumentParser(
+        description=('Run independent headless simulations described in a '
+                     'JSON batch file across a process pool'))
+
+    parser.add_argument(
+        'batch_file',
+        help=('JSON file with the base "config" and "simulation" arguments '
+              'and a list of "runs", each run can set its name, seed, '
+              'max_ticks, max_time, out_file, report_file and override '
+              '"config" and "simulation" arguments')
+    )
+    parser.add_argument(
+        '-j', '--processes',
+        type=lambda x : integer_min_limit('Number of processes', 1, x),
+        default=None,
+        help='Number of worker processes, defaults to the number of CPUs'
+    )
+    parser.add_argument(
+        '-o', '--results-file', default=None,
+        help='Name of the file where run summaries are written as JSON lines'
+    )
+    parser.add_argument(
+        '--seeds',
+        type=lambda x : interval_integer_min_limit('Seeds', 0, x),
+        default=None,
+        help=('Repeat every run for each seed of this interval min-max, '
+              'out_file and report_file can use {name} and {seed}')
+    )
+
+    args = parser.parse_args()
+
+    with open(args.batch_file) as file:
+        batch_info = json.load(file)
+
+    seeds = args.seeds
+    if isinstance(seeds, int):
+        seeds = (seeds,)
+    elif seeds is not None:
+        seeds = range(seeds[0], seeds[1] + 1)
+
+    runs = loadBatchRuns(batch_info.get('runs'), seeds)
+
+    for result in runBatch(runs, batch_info.get('config'),
+                           batch_info.get('simulation'),
+                           args.processes or batch_info.get('processes'),
+                           args.results_file):
+        if 'error' in result:
+            print(f"{result['name']}: failed with {result['error']}")
+        else:
+            print(('{name}: tick {tick}, {ticks_per_second:.1f} ticks/s, '
+                   '{creatures} creatures, {species} species').format(
+                       **result))
+
+if __name__ == '__main__':
+    main()
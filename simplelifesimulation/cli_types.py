@@ -0,0 +1,75 @@
+import argparse
+
+from .simulation.scheduler import PhaseScheduler
+
+def interval_integer_min_limit(arg_name, min_, arg):
+
+    values = arg.split('-')
+
+    if len(values) > 2:
+        raise argparse.ArgumentTypeError(
+            "%s cannot contain more than one '-' character" % arg_name)
+
+    if len(values) == 2:
+
+        min_ = integer_min_limit(arg_name + '(min value)', min_, values[0])
+        max_ = integer_min_limit(arg_name + '(max value)', min_, values[1])
+        if min_ > max_:
+            raise argparse.ArgumentTypeError(
+                "%s min value must be lower than max value" % arg_name)
+
+        return min_, max_
+
+    return integer_min_limit(arg_name, min_, arg)
+
+def integer_min_limit(arg_name, min_, x):
+
+    try:
+        x = int(x)
+    except ValueError:
+        raise argparse.ArgumentTypeError("%s must be an integer" % arg_name)
+
+    if x < min_:
+        raise argparse.ArgumentTypeError(
+            "%s must be higher or equal to %d" % (arg_name, min_))
+
+    return x
+
+def interval_integer(arg_name, min_, max_, x):
+
+    x = integer_min_limit(arg_name, min_, x)
+
+    if x > max_:
+        raise argparse.ArgumentTypeError(
+            "%s must be lower or equal to %d" % (arg_name, max_))
+
+    return x
+
+def real_min_limit(arg_name, min_, x):
+
+    try:
+        x = float(x)
+    except ValueError:
+        raise argparse.ArgumentTypeError("%s must be a number" % arg_name)
+
+    if x < min_:
+        raise argparse.ArgumentTypeError(
+            "%s must be higher or equal to %d" % (arg_name, min_))
+
+    return x
+
+def phase_period(arg):
+
+    values = arg.split('=')
+
+    if len(values) != 2:
+        raise argparse.ArgumentTypeError(
+            "Phase period must have the format PHASE=PERIOD")
+
+    phase, period = values
+
+    if phase not in PhaseScheduler.PHASES:
+        raise argparse.ArgumentTypeError(
+            "Phase must be one of: %s" % ', '.join(PhaseScheduler.PHASES))
+
+    return phase, integer_min_limit('Phase period', 1, period)
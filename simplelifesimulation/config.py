@@ -0,0 +1,61 @@
+from pathlib import Path
+import json
+
+from .creatures.creature import Creature
+from .creatures.materials.rule import loadConvertionRules
+from .creatures.materials.material import loadMaterials
+from .creatures.traits import getCreatureTraits, TraitSchema
+
+def defaultConfigDir():
+
+    current_file_path = Path(__file__)
+    config_dir = current_file_path.parent.joinpath('data')
+
+    if not config_dir.exists():
+        config_dir = current_file_path.parents[1].joinpath('data')
+
+    return config_dir
+
+def loadCreatureConfig(config_dir=None, materials_config=None,
+                       material_rules_config=None, materials_quantity=None,
+                       starting_materials_multiplier=1,
+                       energy_consume_multiplier=1, vision='polygon'):
+
+    config_dir = Path(defaultConfigDir() if config_dir is None else config_dir)
+
+    if material_rules_config is None:
+        material_rules_config = config_dir.joinpath(
+            'material_convertion_rules.json')
+
+    if materials_config is None:
+        materials_config = config_dir.joinpath('materials.json')
+
+    if materials_quantity is None:
+        materials_quantity = config_dir.joinpath(
+            'materials_initial_quantity.json')
+
+    materials_all = loadMaterials(materials_config)
+    materials = materials_all.materials
+
+    convertion_rules = loadConvertionRules(material_rules_config, materials)
+
+    with open(materials_quantity) as file:
+        materials_qtd_file_content = json.load(file)
+
+    initial_materials = {
+        material: materials_qtd_file_content.get(
+            material.name, 0)*starting_materials_multiplier
+        for material in materials.values()
+    }
+
+    traits = getCreatureTraits(
+        materials, materials_all.energy_materials,
+        materials_all.waste_materials, convertion_rules, initial_materials)
+
+    creature_config = Creature.Config(
+        energy_consume_multiplier=energy_consume_multiplier,
+        vision=vision, materials=materials_all,
+        material_rules=convertion_rules, traits=traits,
+        trait_schema=TraitSchema(traits, materials_all, convertion_rules))
+
+    return creature_config, initial_materials
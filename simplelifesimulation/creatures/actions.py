@@ -8,7 +8,7 @@ from pymunk import Vec2d
 class AbstractAction(ABC):
 
     @abstractmethod
-    def doAction(self, creature):
+    def doAction(self, creature, ticks=1):
         pass
 
 class IdleAction(ABC):
@@ -18,12 +18,12 @@ class IdleAction(ABC):
 
         self._time = time
 
-    def doAction(self, _creature):
+    def doAction(self, _creature, ticks=1):
 
         if self._time <= 0:
             return None
 
-        self._time -= 1
+        self._time -= ticks
 
         return 0, 0
 
@@ -39,7 +39,7 @@ class GoToPointAction(AbstractAction):
         self._point = Vec2d(x, y)
         self._target_body_part = target_body_part
 
-    def doAction(self, creature):
+    def doAction(self, creature, ticks=1):
 
         if self._target_body_part == GoToPointAction.BODY_PART.head:
             pos = creature.headposition
@@ -111,7 +111,7 @@ class RotateAction(AbstractAction):
 
         self._angle = angle
 
-    def doAction(self, creature):
+    def doAction(self, creature, ticks=1):
 
         angle1 = creature.body.angle%(2*pi)
         angle2 = self._angle
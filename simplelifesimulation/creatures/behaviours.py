@@ -2,7 +2,6 @@
 from abc import ABC, abstractmethod
 
 import random
-from random import randint
 
 from math import pi, inf
 
@@ -28,8 +27,55 @@ class AbstractBehaviour(ABC):
     def soundAlert(self, creature, x_pos, y_pos):
         pass
 
+    def visionAlerts(self, creature, others, resources):
+
+        other = self._selectCreature(creature, others)
+        if other is not None:
+
+            # pylint: disable=assignment-from-none
+            new_action = self.visionAlert(creature, other)
+            # pylint: enable=assignment-from-none
+
+            if new_action is not None or creature.behaviour is not self:
+                return new_action
+
+        resource = self._selectResource(creature, resources)
+        if resource is not None:
+            return self.visionResourceAlert(creature, resource)
+
+        return None
+
+    @staticmethod
+    def _squaredDistance(creature, other):
+
+        c_pos = creature.body.position
+        o_pos = other.body.position
+
+        return (c_pos.x - o_pos.x)**2 + (c_pos.y - o_pos.y)**2
+
+    def _selectCreature(self, creature, others):
+
+        if not others:
+            return None
+
+        return min(others, key=lambda other: (
+            other.shape.radius, self._squaredDistance(creature, other)))
+
+    def _selectResource(self, creature, resources):
+
+        resources = [resource for resource in resources
+                     if resource.shape.radius > 0]
+
+        if not resources:
+            return None
+
+        return min(resources, key=lambda resource: self._squaredDistance(
+            creature, resource))
+
 class DefaultVisionSoundReactionBehaviour(AbstractBehaviour): # pylint: disable=abstract-method
 
+    FILTER_RESOURCE_SIZE = True
+
     def visionAlert(self, creature, other):
         return None
 
@@ -47,12 +93,25 @@ class DefaultVisionSoundReactionBehaviour(AbstractBehaviour): # pylint: disable=
 
         #return RotateAction(atan2(y - pos.y, x - pos.x))
 
+    def _selectResource(self, creature, resources):
+
+        if not self.FILTER_RESOURCE_SIZE:
+            return super()._selectResource(creature, resources)
+
+        radius = creature.shape.radius
+
+        return super()._selectResource(
+            creature, [resource for resource in resources
+                       if radius < 4*resource.shape.radius])
+
 class BasicBehaviour(DefaultVisionSoundReactionBehaviour):
 
     def __init__(self, idle_priority, walk_priority, run_priority,
-                 fast_run_priority, rotate_priority):
+                 fast_run_priority, rotate_priority, rng=random):
         super().__init__()
 
+        self._rng = rng
+
         self._select_priorities = (walk_priority, run_priority, idle_priority,
                                    rotate_priority, fast_run_priority)
         self._priority_sum = sum(self._select_priorities)
@@ -70,7 +129,9 @@ class BasicBehaviour(DefaultVisionSoundReactionBehaviour):
             creature.pushBehaviour(EatingBehaviour())
             return None
 
-        value = randint(0, self._priority_sum - 1)
+        rng = self._rng
+
+        value = rng.randint(0, self._priority_sum - 1)
 
         select = 0
         for priority in self._select_priorities:
@@ -85,10 +146,10 @@ class BasicBehaviour(DefaultVisionSoundReactionBehaviour):
             radius = creature.shape.radius
 
             dist = 20
-            target_x = randint(int(pos.x - dist*radius),
-                               int(pos.x + dist*radius))
-            target_y = randint(int(pos.y - dist*radius),
-                               int(pos.y + dist*radius))
+            target_x = rng.randint(int(pos.x - dist*radius),
+                                   int(pos.x + dist*radius))
+            target_y = rng.randint(int(pos.y - dist*radius),
+                                   int(pos.y + dist*radius))
 
             if select == 0:
                 return WalkAction(target_x, target_y)
@@ -99,15 +160,17 @@ class BasicBehaviour(DefaultVisionSoundReactionBehaviour):
             return FastRunAction(target_x, target_y)
 
         if select == 2:
-            return IdleAction(randint(20, 80))
+            return IdleAction(rng.randint(20, 80))
 
         if select == 3:
-            return RotateAction(2*pi*random.random())
+            return RotateAction(2*pi*rng.random())
 
         return None
 
 class EatingBehaviour(DefaultVisionSoundReactionBehaviour):
 
+    FILTER_RESOURCE_SIZE = False
+
     def __init__(self, resource=None):
         super().__init__()
 
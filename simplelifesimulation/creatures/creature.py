@@ -1,7 +1,9 @@
 
 from collections import namedtuple
 
-from math import sqrt, floor, pi, cos, sin, ceil, isclose
+import random
+
+from math import sqrt, floor, pi, cos, sin, isclose
 
 import pymunk
 
@@ -10,8 +12,9 @@ from ..simulation.collisiontypes import CREATURE_COLLISION_TYPE
 
 from .behaviours import BasicBehaviour
 from .species import Species
-from .sensors import VisionSensor
+from .sensors import VISION_SENSORS
 from .materials.material import MaterialsGroup
+from .store import CreatureStore
 
 class Creature(CircleSimulationObject):
 
@@ -19,32 +22,44 @@ class Creature(CircleSimulationObject):
 
     Config = namedtuple(
         'CreatureConfig', ('energy_consume_multiplier', 'eating_multiplier',
-                           'materials', 'material_rules', 'traits'))
+                           'materials', 'material_rules', 'traits',
+                           'trait_schema', 'vision'))
     Config.__new__.__defaults__ = (
-        1, 1, None, None, None
+        1, 1, None, None, None, None, 'polygon'
     )
 
     EnergyMaterialInfo = namedtuple('EnergyMaterialInfo', ('priority',))
 
+    DerivedParameters = namedtuple(
+        'DerivedParameters', ('energy_consume_rate', 'eat_speed_base',
+                              'eat_speed', 'vision_range_multiplier',
+                              'vision_angle', 'speed', 'speed_sqrt',
+                              'energy_materials'))
+
     MASS_MULTIPLIER = MaterialsGroup.MASS_MULTIPLIER
 
     def __init__(self, space, *args, **kwargs):
 
         self.__config = kwargs.pop('config', None)
-        self.__materials = MaterialsGroup(kwargs.pop('materials', None),
-                                          self.__config.materials)
+        materials = kwargs.pop('materials', None)
+        self.__store = kwargs.pop('store', None)
+        self.__rng = kwargs.pop('rng', random)
+        self._id = kwargs.pop('id_', None)
 
         if self.__config is None:
             self.__config = Creature.Config()
 
-        if self.__materials is None:
-            self.__materials = MaterialsGroup({
-                material: 0 for material in
-                self.__config.materials.materials.values()
-            }, self.__config.materials)
-        else:
-            self.__materials = MaterialsGroup(
-                self.__materials, self.__config.materials)
+        if self.__store is None:
+            self.__store = CreatureStore(self.__config)
+
+        self.__slot = self.__store.allocate(self)
+
+        if materials is not None:
+            self.__store.setMaterials(self.__slot, materials)
+
+        self.__materials = MaterialsGroup(
+            self.__store.materialsView(self.__slot), self.__config.materials,
+            copy=False)
 
         if len(args) == 1 and not kwargs:
 
@@ -54,15 +69,10 @@ class Creature(CircleSimulationObject):
 
             self._id = creature_info.get('id', -1)
 
-            species_name = creature_info.get('species')
-            for species in Species.getAllSpecies():
-                if species == species_name:
-                    self.__species = species
-                    break
-            else:
-                self.__species = None
-
-            self.__traits = creature_info.get('traits')
+            self.__traits = self.__config.trait_schema.vectorFromDict(
+                creature_info.get('traits', {}))
+            self.__store.setTraits(self.__slot, self.__traits)
+            self.__derived = self.__getDerivedParameters()
             self._is_eating = False
             self._action = None
             self.selected = False
@@ -71,47 +81,68 @@ class Creature(CircleSimulationObject):
             saved_materials = creature_info.get('materials')
             if saved_materials:
                 for material, qtd in saved_materials.items():
-                    self.__materials[
-                        self.__config.materials.materials.get(material)] = qtd
+                    material = self.__config.materials.materials.get(
+                        material)
+                    if material is not None:
+                        self.__materials[material] = qtd
 
             super().__init__(space, info)
 
-            self._behaviours = [BasicBehaviour(
-                self.getTrait('idlepriority') + 1,
-                self.getTrait('walkpriority'),
-                self.getTrait('runpriority'),
-                self.getTrait('fastrunpriority'),
-                self.getTrait('rotatepriority'))]
+            self.shape.collision_type = CREATURE_COLLISION_TYPE
+            self.shape.filter = pymunk.ShapeFilter(
+                categories=(1 << (CREATURE_COLLISION_TYPE - 1)))
+
+            self._behaviours = [self.__newBasicBehaviour()]
 
-            radius = self.shape.radius
-            self._vision_sensor = VisionSensor(
-                self, radius + 10*radius*self.getTrait('visiondistance'),
-                pi*(10 + 210*self.getTrait('visionangle'))/180)
+            self._vision_sensor = self.__newVisionSensor(self.shape.radius)
 
         else:
             self.__construct(space, *args, **kwargs)
 
-        self.__energy_materials = self.__getMaterialInfo(
-            '{}_energypriority', self.__config.materials.energy_materials,
-            Creature.EnergyMaterialInfo,
+        self.__spent_energy = 0
+
+    def __getDerivedParameters(self):
+
+        schema = self.__config.trait_schema
+        traits = self.__traits
+
+        vision_distance = traits[schema.visiondistance_slot]
+        vision_angle = traits[schema.visionangle_slot]
+        speed = traits[schema.speed_slot]
+        eating_speed = traits[schema.eatingspeed_slot]
+
+        energy_consume_vision = (0.1 + vision_distance)*(1 + vision_angle)
+        energy_consume_eat_speed = 0.2*eating_speed
+
+        eat_speed_base = (0.3 + eating_speed)/3
+
+        energy_materials = self.__getMaterialInfo(
+            schema.energy_priority_slots, Creature.EnergyMaterialInfo,
             lambda material, priority: priority/material.energy_efficiency)
-        self.__structure = 0
-        self.__energy = 0
 
-        self.__spent_energy = 0
+        return Creature.DerivedParameters(
+            energy_consume_rate=(energy_consume_vision + speed +
+                                 energy_consume_eat_speed),
+            eat_speed_base=eat_speed_base,
+            eat_speed=40*self.__config.eating_multiplier*eat_speed_base,
+            vision_range_multiplier=1 + 10*vision_distance,
+            vision_angle=pi*(10 + 210*vision_angle)/180,
+            speed=speed,
+            speed_sqrt=sqrt(speed + 0.01),
+            energy_materials=energy_materials
+        )
 
-    def __getMaterialInfo(self, priority_trait_formula, materials, info_class,
+    def __getMaterialInfo(self, priority_slots, info_class,
                           priority_function):
-        if len(materials) == 1:
-            material = next(iter(materials))
+        if len(priority_slots) == 1:
+            material = next(iter(priority_slots))
             return {
                 material: info_class(priority_function(material, 1))
             }
 
         material_priorities = tuple(
-            (material,
-             self.getTrait(priority_trait_formula.format(material.name)))
-            for material in materials
+            (material, self.__traits[slot])
+            for material, slot in priority_slots.items()
         )
         total_priority = sum(
             priority for _, priority in material_priorities)
@@ -123,16 +154,21 @@ class Creature(CircleSimulationObject):
 
     def __construct(self, space, x, y, parent=None):
 
+        schema = self.__config.trait_schema
+
         if parent is None:
-            self.__traits = {trait.name: trait.random()
-                             for trait in self.__config.traits}
-            self.__species = Species(self.__traits)
+            self.__traits = tuple(trait.random(self.__rng)
+                                  for trait in schema.traits)
+            self.__species = Species(schema.vectorToDict(self.__traits))
         else:
-            self.__traits = {trait.name:
-                                 trait.mutate(parent.__traits[trait.name])
-                             for trait in self.__config.traits}
+            self.__traits = tuple(
+                trait.mutate(value, self.__rng)
+                for trait, value in zip(schema.traits, parent.__traits))
             self.__species = parent.species.getChildSpecies(
-                self.__config.traits, self.__traits)
+                schema.traits, schema.vectorToDict(self.__traits))
+
+        self.__store.setTraits(self.__slot, self.__traits)
+        self.__derived = self.__getDerivedParameters()
 
         mass = self.__materials.mass
         radius = self.__materials.radius
@@ -143,36 +179,47 @@ class Creature(CircleSimulationObject):
         self.shape.filter = pymunk.ShapeFilter(
             categories=(1 << (CREATURE_COLLISION_TYPE - 1)))
 
-        self._id = self.__newId()
+        if self._id is None:
+            self._id = self.__newId()
 
         self._is_eating = 0
-        self._behaviours = [BasicBehaviour(
-            self.getTrait('idlepriority') + 1, self.getTrait('walkpriority'),
-            self.getTrait('runpriority'), self.getTrait('fastrunpriority'),
-            self.getTrait('rotatepriority'))]
+        self._behaviours = [self.__newBasicBehaviour()]
 
         self._action = None
 
         #self._sound_sensor = SoundSensor(self, 200)
-        self._vision_sensor = \
-            VisionSensor(self,
-                         radius + 10*radius*self.getTrait('visiondistance'),
-                         pi*(10 + 210*self.getTrait('visionangle'))/180)
+        self._vision_sensor = self.__newVisionSensor(radius)
 
         self.selected = False
 
+    def __newVisionSensor(self, radius):
+        return VISION_SENSORS[self.__config.vision](
+            self, radius*self.__derived.vision_range_multiplier,
+            self.__derived.vision_angle)
+
+    def __newBasicBehaviour(self):
+
+        schema = self.__config.trait_schema
+        traits = self.__traits
+
+        return BasicBehaviour(traits[schema.idlepriority_slot] + 1,
+                              traits[schema.walkpriority_slot],
+                              traits[schema.runpriority_slot],
+                              traits[schema.fastrunpriority_slot],
+                              traits[schema.rotatepriority_slot],
+                              rng=self.__rng)
+
     def reproduce(self, simulation):
 
-        child_materials = {}
-        for material_name, material in \
-                self.__config.materials.materials.items():
+        traits = self.__traits
 
-            if material.ignore_for_child:
-                continue
+        child_materials = {}
+        for material, child_slot, _ in \
+                self.__config.trait_schema.child_slots:
 
             material_qtd = self.__materials.get(material, 0)
 
-            child_qtd = self.getTrait(f'{material_name}_childqtd')
+            child_qtd = traits[child_slot]
 
             if material_qtd < child_qtd:
                 child_qtd = material_qtd
@@ -189,7 +236,7 @@ class Creature(CircleSimulationObject):
         return self.__materials[material]
 
     def getTrait(self, trait):
-        return self.__traits[trait]
+        return self.__traits[self.__config.trait_schema.index(trait)]
 
     @property
     def headposition(self):
@@ -203,12 +250,12 @@ class Creature(CircleSimulationObject):
 
         return pos
 
-    def eat(self, simulation, resource):
+    def eat(self, simulation, resource, ticks=1):
+
+        derived = self.__derived
 
-        eat_speed_base = (0.3 + self.getTrait('eatingspeed'))/3
-        eat_speed = 40*self.__config.eating_multiplier*eat_speed_base
         materials_gained = resource.consume(
-            simulation, self.body.mass*eat_speed)
+            simulation, ticks*self.body.mass*derived.eat_speed)
 
         mass_gained = materials_gained.mass
 
@@ -217,9 +264,9 @@ class Creature(CircleSimulationObject):
 
         self.__materials.merge(materials_gained)
 
-        self.__spent_energy += int((eat_speed_base/2)*mass_gained)
+        self.__spent_energy += int((derived.eat_speed_base/2)*mass_gained)
 
-        self._is_eating = 5
+        self._is_eating = 5*ticks
 
         self.__updateSelf()
 
@@ -264,6 +311,14 @@ class Creature(CircleSimulationObject):
         if new_action is not None:
             self._action = new_action
 
+    def visionAlerts(self, creatures, resources):
+
+        new_action = self._behaviours[-1].visionAlerts(
+            self, creatures, resources)
+
+        if new_action is not None:
+            self._action = new_action
+
     def __updateSelf(self):
 
         self.body.mass = self.__materials.mass
@@ -272,64 +327,104 @@ class Creature(CircleSimulationObject):
         if not isclose(new_radius, self.shape.radius, rel_tol=0.05):
             self.shape.unsafe_set_radius(new_radius)
             self._vision_sensor.distance = \
-                new_radius + 10*new_radius*self.getTrait('visiondistance')
+                new_radius*self.__derived.vision_range_multiplier
 
     @property
     def eating(self):
         return self._is_eating > 0
 
-    def act(self, simulation):
+    def act(self, simulation, materials_converted=False):
+
+        if self.metabolize(simulation,
+                           materials_converted=materials_converted):
+            self.behave(simulation)
 
-        for rule in self.__config.material_rules:
-            rule.convert(self.__structure, self.__materials,
-                         self.getTrait(f'{rule.name}_convertionrate'))
+    def metabolize(self, simulation, ticks=1, materials_converted=False):
+
+        store = self.__store
+        schema = self.__config.trait_schema
+        traits = self.__traits
+
+        if materials_converted:
+            energy = store.energy.item(self.__slot)
+        else:
+            for rule, rate_slot in zip(self.__config.material_rules,
+                                       schema.convertion_rate_slots):
+                rule.convert(self.structure, self.__materials,
+                             traits[rate_slot]*ticks)
 
-        self.__structure = self.__materials.structure
-        self.__energy = self.__materials.energy
+            store.structure[self.__slot] = self.__materials.structure
+            energy = store.energy[self.__slot] = self.__materials.energy
 
-        energy_consume_vision = (0.1 + self.getTrait('visiondistance'))*\
-            (1 + self.getTrait('visionangle'))
-        energy_consume_speed = self.getTrait('speed')
-        energy_consume_eat_speed = 0.2*self.getTrait('eatingspeed')
-        base_energy_consume = self.body.mass*(energy_consume_vision + \
-            energy_consume_speed + energy_consume_eat_speed)//100
+        base_energy_consume = \
+            self.body.mass*self.__derived.energy_consume_rate//100
 
-        base_energy_consume = int(
-            40*base_energy_consume*self.__config.energy_consume_multiplier) + 1
+        base_energy_consume = ticks*(int(
+            40*base_energy_consume*self.__config.energy_consume_multiplier) + 1)
 
         base_energy_consume += self.__spent_energy
         self.__spent_energy = 0
 
-        if base_energy_consume > self.__energy:
+        if base_energy_consume > energy:
             self.kill(simulation)
-            return
+            return False
 
         self.__consumeEnergy(base_energy_consume)
 
-        for material_name, material in \
-                self.__config.materials.materials.items():
-
-            if material.ignore_for_child:
-                continue
+        for material, child_slot, overflow_min_slot in schema.child_slots:
 
             material_qtd = self.__materials.get(material, 0)
 
-            child_qtd = self.getTrait(f'{material_name}_childqtd')
-            overflow_min = self.getTrait(
-                f'{material_name}_childqtd_min_to_reproduce')
+            child_qtd = traits[child_slot]
+            overflow_min = traits[overflow_min_slot]
 
             if material_qtd < child_qtd*overflow_min:
                 break
         else:
             self.reproduce(simulation)
 
+        total_mass = self.body.mass/Creature.MASS_MULTIPLIER
+        for material, waste_slot in schema.waste_slots:
+
+            rsc_qtd = self.__materials.get(material, 0)
+            if rsc_qtd < 1000:
+                continue
+
+            material_info = self.__config.materials.materials[material.name]
+            material_mass = rsc_qtd*material_info.mass
+
+            waste_desired_qtd = traits[waste_slot]
+
+            if material_mass > (waste_desired_qtd + 0.05)*total_mass:
+
+                waste_qtd = int((material_mass - \
+                    waste_desired_qtd*total_mass)/material_info.mass)
+
+                if waste_qtd > rsc_qtd:
+                    self.__materials[material] = 0
+                    waste_qtd = rsc_qtd
+                else:
+                    self.__materials[material] -= waste_qtd
+
+                simulation.depositWaste(*self.body.position, waste_qtd)
+
+        if self.__materials.mass <= 0:
+            self.kill(simulation)
+            return False
+
+        self.__updateSelf()
+
+        return True
+
+    def behave(self, _simulation, ticks=1):
+
         if self._is_eating > 0:
-            self._is_eating -= 1
+            self._is_eating -= ticks
 
         while self._action is None:
             self._action = self._behaviours[-1].selectAction(self)
 
-        action_result = self._action.doAction(self)
+        action_result = self._action.doAction(self, ticks)
 
         if action_result is None:
             self._action = None
@@ -347,66 +442,53 @@ class Creature(CircleSimulationObject):
         elif angle_factor < -1:
             angle_factor = -1
 
-        self.__doSpeed(speed_factor)
-        self.__doAngleSpeed(angle_factor)
-
-        total_mass = self.body.mass/Creature.MASS_MULTIPLIER
-        for material in self.__config.materials.waste_materials:
-
-            rsc_qtd = self.__materials.get(material, 0)
-            if rsc_qtd < 1000:
-                continue
-
-            material_info = self.__config.materials.materials[material.name]
-            material_mass = rsc_qtd*material_info.mass
-
-            waste_desired_qtd = self.getTrait(
-                f'{material.name}_waste_qtd_to_remove')
+        self.__doSpeed(speed_factor, ticks)
+        self.__doAngleSpeed(angle_factor, ticks)
 
-            if material_mass > (waste_desired_qtd + 0.05)*total_mass:
+    def kill(self, simulation):
 
-                waste_qtd = int((material_mass - \
-                    waste_desired_qtd*total_mass)/material_info.mass)
+        position = self.body.position
+        materials = dict(self.__materials)
 
-                if waste_qtd > rsc_qtd:
-                    self.__materials[material] = 0
-                    waste_qtd = rsc_qtd
-                else:
-                    self.__materials[material] -= waste_qtd
+        if simulation.delCreature(self):
+            simulation.newMeatResource(*position, materials)
 
-                simulation.newResource(*self.body.position, waste_qtd, 0)
+    def destroy(self, space_objects=None):
+        if not self.destroyed:
+            super().destroy(space_objects=space_objects)
+            self.__store.release(self.__slot)
 
-        self.__updateSelf()
+    def _spaceObjects(self):
+        return (*super()._spaceObjects(), *self._vision_sensor.shapes)
 
-    def kill(self, simulation):
-        simulation.delCreature(self)
-        simulation.newMeatResource(*self.body.position, self.__materials)
+    def __doSpeed(self, factor, ticks):
 
-    def __doSpeed(self, factor):
+        struct_factor = Creature.MASS_MULTIPLIER*self.structure/self.body.mass
 
-        struct_factor = Creature.MASS_MULTIPLIER*self.__structure/self.body.mass
+        derived = self.__derived
 
-        speed_trait = self.getTrait('speed')
-        speed = 50*(factor**2)*(speed_trait*struct_factor + 0.01)
+        speed = 50*(factor**2)*(derived.speed*struct_factor + 0.01)
         if factor < 0:
             speed = -speed
 
         energy_consume = int(abs(speed*self.body.mass*factor* \
-            (1 + 2*abs(factor - 0.5))*sqrt(speed_trait + 0.01))//100)
+            (1 + 2*abs(factor - 0.5))*derived.speed_sqrt)//100)
 
-        self.__spent_energy += energy_consume
+        self.__spent_energy += ticks*energy_consume
 
         angle = self.body.angle
 
         if factor < 0:
             speed /= 4
 
+        speed *= ticks
+
         self.body.velocity += (speed*cos(angle), speed*sin(angle))
 
-    def __doAngleSpeed(self, factor):
+    def __doAngleSpeed(self, factor, ticks):
 
-        struct_factor = Creature.MASS_MULTIPLIER*self.__structure/self.body.mass
-        speed_trait_factor = max(self.getTrait('speed')*struct_factor/100, 0)
+        struct_factor = Creature.MASS_MULTIPLIER*self.structure/self.body.mass
+        speed_trait_factor = max(self.__derived.speed*struct_factor/100, 0)
         velocity = self.body.velocity
         current_speed = sqrt(velocity.x**2 + velocity.y**2)
 
@@ -416,9 +498,9 @@ class Creature(CircleSimulationObject):
         energy_consume = abs(floor(angular_speed*self.body.mass*factor* \
             sqrt(speed_trait_factor + 0.2)))//50
 
-        self.__spent_energy += energy_consume
+        self.__spent_energy += ticks*energy_consume
 
-        self.body.angular_velocity += angular_speed
+        self.body.angular_velocity += ticks*angular_speed
 
     def draw(self, painter, color=None):
 
@@ -448,7 +530,8 @@ class Creature(CircleSimulationObject):
     def __consumeEnergy(self, qtd, iteration=0):
 
         missing_to_spent = 0
-        for material, material_info in self.__energy_materials.items():
+        for material, material_info in \
+                self.__derived.energy_materials.items():
             material_qtd = self.__materials[material]
             material_consume = int(material_info.priority*qtd)
             if material_consume > material_qtd:
@@ -468,7 +551,8 @@ class Creature(CircleSimulationObject):
                 return self.__consumeEnergy(
                     missing_to_spent, iteration=iteration + 1)
 
-            for material, material_info in self.__energy_materials.items():
+            for material, material_info in \
+                self.__derived.energy_materials.items():
                 material_qtd = self.__materials[material]
                 material_consume = \
                     missing_to_spent/material.energy_efficiency
@@ -505,16 +589,28 @@ class Creature(CircleSimulationObject):
 
     @property
     def energy(self):
-        return self.__energy
+        return self.__store.energy.item(self.__slot)
 
     @property
     def structure(self):
-        return self.__structure
+        return self.__store.structure.item(self.__slot)
+
+    @property
+    def store(self):
+        return self.__store
+
+    @property
+    def slot(self):
+        return self.__slot
 
     @property
     def currentspeed(self):
         return self.body.velocity.length
 
+    @property
+    def behaviour(self):
+        return self._behaviours[-1]
+
     @property
     def currentvisiondistance(self):
         return self._vision_sensor.distance
@@ -530,8 +626,8 @@ class Creature(CircleSimulationObject):
         base_dict['creature'] = {
             'id': self._id,
             'species': self.__species.name,
-            'traits': self.__traits,
-            'materials': self.__materials.getSerializable()
+            'traits': self.__config.trait_schema.vectorToDict(self.__traits),
+            'materials': self.__materials.getSerializable
         }
 
         return base_dict
@@ -163,8 +163,8 @@ class MaterialsGroup(MutableMapping):
 
     MASS_MULTIPLIER = 1/10000
 
-    def __init__(self, materials, config=None):
-        self.__materials = dict(materials)
+    def __init__(self, materials, config=None, copy=True):
+        self.__materials = dict(materials) if copy else materials
         self.__config = config
         self.__mass = None
         self.__radius = None
@@ -228,15 +228,20 @@ class MaterialsGroup(MutableMapping):
         return self.__materials.get(key, *args)
 
     def __calcMassAndRadius(self):
-        total_mass = 0
-        total_volume = 0
-        for material, qtd in self.__materials.items():
-            total_mass += material.mass*qtd
-            total_volume += material.mass*qtd/material.density
+
+        mass_and_volume = getattr(self.__materials, 'massAndVolume', None)
+        if mass_and_volume is not None:
+            total_mass, total_volume = mass_and_volume()
+        else:
+            total_mass = 0
+            total_volume = 0
+            for material, qtd in self.__materials.items():
+                total_mass += material.mass*qtd
+                total_volume += material.mass*qtd/material.density
 
         final_radius = sqrt(total_volume*MaterialsGroup.MASS_MULTIPLIER)
 
-        self.__mass_radius_ready = True
+        self.__mass_radius_ready = mass_and_volume is None
         self.__mass = total_mass
         self.__radius = final_radius
 
@@ -2,6 +2,8 @@
 import json
 from math import ceil
 
+import numpy
+
 class CreatureMaterialConvertionRule:
 
     REACTION_SPEED_BASE_MULT = 1e-4
@@ -119,6 +121,34 @@ class CreatureMaterialConvertionRule:
     def name(self):
         return self.__name
 
+    @property
+    def input_list(self):
+        return self.__input_list
+
+    @property
+    def output_list(self):
+        return self.__output_list
+
+    @property
+    def catalysts(self):
+        return self.__catalysts
+
+    @property
+    def structure_multiplier(self):
+        return self.__struct_mult
+
+    @property
+    def ingredient_multiplier(self):
+        return self.__ing_mult
+
+    @property
+    def speed(self):
+        return self.__speed
+
+    @property
+    def join_factors_function(self):
+        return self.__join_func
+
     def __str__(self):
         eq_l = ' + '.join(str(mat_info) for mat_info in self.__input_list)
         eq_r = ' + '.join(str(mat_info) for mat_info in self.__output_list)
@@ -128,6 +158,103 @@ class CreatureMaterialConvertionRule:
     def __repr__(self):
         return f'CreatureMaterialConvertionRule({str(self)})'
 
+class ConvertionRulesEngine:
+
+    def __init__(self, rules, materials):
+
+        self.__rules = tuple(rules)
+
+        material_index = {
+            material: i for i, material in enumerate(materials)
+        }
+
+        self.__input_matrix = numpy.zeros((len(self.__rules), len(materials)))
+        self.__output_matrix = numpy.zeros(
+            (len(self.__rules), len(materials)))
+
+        self.__compiled = []
+        for i, rule in enumerate(self.__rules):
+
+            if rule.join_factors_function is not min:
+                raise ValueError(
+                    f'Rule {rule.name} cannot be compiled, only min is '
+                    'supported as join factors function')
+
+            for material_info in rule.input_list:
+                self.__input_matrix[
+                    i, material_index[material_info.material]] += \
+                        material_info.quantity
+
+            for material_info in rule.output_list:
+                self.__output_matrix[
+                    i, material_index[material_info.material]] += \
+                        material_info.quantity
+
+            input_columns = numpy.flatnonzero(self.__input_matrix[i])
+            output_columns = numpy.flatnonzero(self.__output_matrix[i])
+
+            catalysts = tuple(
+                (material_index[catalyst_info.material], catalyst_info.effect)
+                for catalyst_info in (rule.catalysts or ())
+            )
+
+            self.__compiled.append((
+                input_columns, self.__input_matrix[i, input_columns],
+                output_columns, self.__output_matrix[i, output_columns],
+                catalysts, rule.structure_multiplier,
+                rule.ingredient_multiplier, rule.speed
+            ))
+
+    def convert(self, materials, structure, rates):
+
+        base_mult = CreatureMaterialConvertionRule.REACTION_SPEED_BASE_MULT
+
+        for i, (input_columns, input_qtd, output_columns, output_qtd,
+                catalysts, struct_mult, ing_mult, speed) in \
+                enumerate(self.__compiled):
+
+            factor = None
+            if catalysts:
+                catalyst_factor = 0
+                for column, effect in catalysts:
+                    catalyst_factor = \
+                        catalyst_factor + materials[:, column]*effect
+                factor = catalyst_factor
+
+            if struct_mult:
+                struct_factor = structure*struct_mult
+                factor = struct_factor if factor is None else \
+                    numpy.minimum(factor, struct_factor)
+
+            current_qtd = materials[:, input_columns]
+            max_reactions = numpy.floor_divide(
+                current_qtd, input_qtd).min(axis=1)
+
+            if ing_mult:
+                ing_factor = max_reactions*ing_mult
+                factor = ing_factor if factor is None else \
+                    numpy.minimum(factor, ing_factor)
+
+            reactions = numpy.ceil(rates[:, i]*speed*base_mult*factor)
+            reactions = numpy.minimum(reactions, max_reactions)
+            reactions[~(reactions > 0)] = 0
+
+            materials[:, input_columns] = \
+                current_qtd - reactions[:, None]*input_qtd
+            materials[:, output_columns] += reactions[:, None]*output_qtd
+
+    @property
+    def rules(self):
+        return self.__rules
+
+    @property
+    def input_matrix(self):
+        return self.__input_matrix
+
+    @property
+    def output_matrix(self):
+        return self.__output_matrix
+
 def __loadConvertionRuleMaterialInfo(material_info_list, materials):
     return [
         CreatureMaterialConvertionRule.MaterialInfo(
@@ -107,3 +107,69 @@ class VisionSensor:
     @property
     def angle(self):
         return self._angle
+
+class CircleVisionSensor:
+
+    def __init__(self, creature, sensor_range, sensor_angle,
+                 offset_angle=0):
+
+        self._shape = pymunk.Circle(creature.body, sensor_range, (0, 0))
+
+        self._shape.collision_type = VISION_SENSOR_COLLISION_TYPE
+        self._shape.filter = pymunk.ShapeFilter(
+            categories=(1 << (VISION_SENSOR_COLLISION_TYPE - 1)))
+        self._shape.sensor = True
+
+        self._shape.creature = creature
+
+        creature.body.space.add(self._shape)
+
+        self._angle = sensor_angle
+        self._offset_angle = offset_angle
+
+    @property
+    def distance(self):
+        return self._shape.radius
+
+    @distance.setter
+    def distance(self, new_value):
+        self._shape.unsafe_set_radius(new_value)
+
+    @property
+    def shapes(self):
+        return (self._shape,)
+
+    @property
+    def angle(self):
+        return self._angle
+
+class GridVisionSensor:
+
+    def __init__(self, _creature, sensor_range, sensor_angle,
+                 offset_angle=0):
+
+        self._distance = sensor_range
+        self._angle = sensor_angle
+        self._offset_angle = offset_angle
+
+    @property
+    def distance(self):
+        return self._distance
+
+    @distance.setter
+    def distance(self, new_value):
+        self._distance = new_value
+
+    @property
+    def shapes(self):
+        return ()
+
+    @property
+    def angle(self):
+        return self._angle
+
+VISION_SENSORS = {
+    'polygon': VisionSensor,
+    'circle': CircleVisionSensor,
+    'grid': GridVisionSensor
+}
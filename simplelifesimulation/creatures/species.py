@@ -2,6 +2,8 @@
 class Species:
 
     __all_species = []
+    __species_by_name = {}
+    __name_prefix = ''
 
     def __init__(self, traits, ancestor=None):
 
@@ -10,6 +12,11 @@ class Species:
         self.__ancestor = ancestor
 
         Species.__all_species.append(self)
+        Species.__species_by_name.setdefault(self.__name, self)
+
+    @staticmethod
+    def setNamePrefix(prefix):
+        Species.__name_prefix = prefix
 
     @property
     def name(self):
@@ -30,7 +37,7 @@ class Species:
             i //= interval_size
             i -= 1
 
-        return chr(first_letter_val + i) + name
+        return Species.__name_prefix + chr(first_letter_val + i) + name
 
     def getChildSpecies(self, traits_config, traits):
 
@@ -50,11 +57,7 @@ class Species:
 
     @staticmethod
     def searchByName(name):
-        for species in Species.__all_species:
-            if species.name == name:
-                return species
-
-        return None
+        return Species.__species_by_name.get(name)
 
     @staticmethod
     def loadFromDict(info):
@@ -62,7 +65,11 @@ class Species:
         species = Species(info.get('traits'),
                           Species.searchByName(info.get('ancestor')))
 
+        if Species.__species_by_name.get(species.__name) is species:
+            del Species.__species_by_name[species.__name]
+
         species.__name = info.get('name', 'UNKNOWN')
+        Species.__species_by_name.setdefault(species.__name, species)
 
         return species
 
@@ -0,0 +1,192 @@
+from collections.abc import MutableMapping
+
+import numpy
+
+class MaterialsStore:
+
+    INITIAL_CAPACITY = 64
+
+    class MaterialsView(MutableMapping):
+
+        def __init__(self, store, slot):
+            self.__store = store
+            self.__slot = slot
+
+        def __getitem__(self, key):
+            return self.__store.materials.item(
+                self.__slot, self.__store.materialIndex(key))
+
+        def __setitem__(self, key, value):
+            self.__store.materials[
+                self.__slot, self.__store.materialIndex(key)] = value
+
+        def __delitem__(self, key):
+            self[key] = 0
+
+        def __iter__(self):
+            return iter(self.__store.material_list)
+
+        def __len__(self):
+            return len(self.__store.material_list)
+
+        def massAndVolume(self):
+            row = self.__store.materials[self.__slot]
+            return (float(row @ self.__store.mass_vector),
+                    float(row @ self.__store.volume_vector))
+
+    def __init__(self, materials_config, capacity=INITIAL_CAPACITY):
+
+        self.__materials_config = materials_config
+        self.__material_list = tuple(materials_config.materials.values())
+        self.__material_index = {
+            material: i for i, material in enumerate(self.__material_list)
+        }
+
+        self.mass_vector = self.materialVector('mass')
+        self.volume_vector = self.mass_vector/self.materialVector('density')
+
+        self.__capacity = 0
+        self.__size = 0
+        self.__free_slots = []
+        self.__objects = []
+
+        self.active = numpy.zeros(0, dtype=bool)
+        self.materials = numpy.zeros((0, len(self.__material_list)))
+
+        self._grow(capacity)
+
+    def _columns(self):
+        return ('active', 'materials')
+
+    def _grow(self, capacity):
+
+        for name in self._columns():
+            old_array = getattr(self, name)
+
+            new_array = numpy.zeros((capacity, *old_array.shape[1:]),
+                                    dtype=old_array.dtype)
+            new_array[:len(old_array)] = old_array
+
+            setattr(self, name, new_array)
+
+        self.__objects.extend(None for _ in range(capacity - self.__capacity))
+        self.__capacity = capacity
+
+    def allocate(self, obj):
+
+        if self.__free_slots:
+            slot = self.__free_slots.pop()
+        else:
+            if self.__size == self.__capacity:
+                self._grow(2*self.__capacity)
+            slot = self.__size
+            self.__size += 1
+
+        for name in self._columns():
+            getattr(self, name)[slot] = 0
+
+        self.active[slot] = True
+        self.__objects[slot] = obj
+
+        return slot
+
+    def release(self, slot):
+
+        if not self.active[slot]:
+            return
+
+        self.active[slot] = False
+        self.__objects[slot] = None
+        self.__free_slots.append(slot)
+
+    def setMaterials(self, slot, materials):
+        row = self.materials[slot]
+        for material, qtd in materials.items():
+            row[self.__material_index[material]] = qtd
+
+    def materialsView(self, slot):
+        return MaterialsStore.MaterialsView(self, slot)
+
+    def materialIndex(self, material):
+        return self.__material_index[material]
+
+    def materialVector(self, attribute):
+        return numpy.array([getattr(material, attribute)
+                            for material in self.__material_list],
+                           dtype=float)
+
+    def getObject(self, slot):
+        return self.__objects[slot]
+
+    @property
+    def slots(self):
+        return numpy.flatnonzero(self.active[:self.__size])
+
+    @property
+    def material_list(self):
+        return self.__material_list
+
+    @property
+    def materials_config(self):
+        return self.__materials_config
+
+    @property
+    def capacity(self):
+        return self.__capacity
+
+    def __len__(self):
+        return self.__size - len(self.__free_slots)
+
+class CreatureStore(MaterialsStore):
+
+    def __init__(self, config, capacity=MaterialsStore.INITIAL_CAPACITY):
+
+        self.__trait_schema = config.trait_schema
+
+        self.structure = numpy.zeros(0)
+        self.energy = numpy.zeros(0)
+        self.traits = numpy.zeros((0, len(config.trait_schema)))
+
+        super().__init__(config.materials, capacity)
+
+    def _columns(self):
+        return super()._columns() + ('structure', 'energy', 'traits')
+
+    def setTraits(self, slot, trait_vector):
+        self.traits[slot] = trait_vector
+
+    def convertMaterials(self, engine, ticks=1):
+
+        slots = self.slots
+        if len(slots) == 0:
+            return
+
+        rate_columns = list(self.__trait_schema.convertion_rate_slots)
+
+        materials = self.materials[slots]
+        engine.convert(materials, self.structure[slots],
+                       self.traits[slots][:, rate_columns]*ticks)
+        self.materials[slots] = materials
+
+        self.updateStructureAndEnergy(slots)
+
+    def updateStructureAndEnergy(self, slots):
+
+        materials_config = self.materials_config
+        materials = self.materials
+
+        structure = 0
+        for material in materials_config.structure_materials:
+            structure = structure + material.structure_efficiency*\
+                materials[slots, self.materialIndex(material)]
+        self.structure[slots] = structure
+
+        energy = 0
+        for material in materials_config.energy_materials:
+            energy = energy + material.energy_efficiency*\
+                materials[slots, self.materialIndex(material)]
+        self.energy[slots] = energy
+
+    @property
+    def trait_schema(self):
+        return self.__trait_schema
@@ -1,6 +1,5 @@
 
 import random
-import numpy
 
 class CreatureTrait:
 
@@ -21,6 +20,10 @@ class CreatureTrait:
     def name(self):
         return self.__name
 
+    @property
+    def integer_only(self):
+        return self.__int_only
+
     def valuesSimilarity(self, val1, val2):
 
         if val1 == val2:
@@ -36,17 +39,16 @@ class CreatureTrait:
 
         return 1 - abs(val1 - val2)/(self.__max - self.__min)
 
-    def random(self):
+    def random(self, rng=random):
 
         if self.__initial is not None:
-            return self.mutate(self.__initial)
+            return self.mutate(self.__initial, rng)
 
         diff = self.__max - self.__min
 
         if self.__exp_rnd:
 
-            value = self.__min + min(numpy.random.exponential(diff)/1000,
-                                     diff)
+            value = self.__min + min(rng.expovariate(1/diff)/1000, diff)
 
             if self.__int_only:
                 return int(value)
@@ -54,18 +56,18 @@ class CreatureTrait:
             return value
 
         if self.__int_only:
-            return random.randint(self.__min, self.__max)
+            return rng.randint(self.__min, self.__max)
 
-        return random.random()*(diff) + self.__min
+        return rng.random()*(diff) + self.__min
 
-    def mutate(self, val):
+    def mutate(self, val, rng=random):
 
         if self.__prop_mut:
             mut_base = val
         else:
             mut_base = self.__max - self.__min
 
-        rand_n = 2*(0.5 - random.random())*mut_base
+        rand_n = 2*(0.5 - rng.random())*mut_base
         val += rand_n*self.__mut
 
         if self.__int_only:
@@ -111,6 +113,75 @@ def getCreatureTraits(materials, energy_materials, waste_materials,
 
     return traits
 
+class TraitSchema:
+
+    def __init__(self, traits, materials, material_rules):
+
+        self.__traits = tuple(traits)
+        self.__names = tuple(trait.name for trait in self.__traits)
+        self.__index = {name: i for i, name in enumerate(self.__names)}
+        self.__integer = tuple(trait.integer_only for trait in self.__traits)
+
+        self.speed_slot = self.__index['speed']
+        self.eatingspeed_slot = self.__index['eatingspeed']
+        self.visiondistance_slot = self.__index['visiondistance']
+        self.visionangle_slot = self.__index['visionangle']
+        self.walkpriority_slot = self.__index['walkpriority']
+        self.runpriority_slot = self.__index['runpriority']
+        self.fastrunpriority_slot = self.__index['fastrunpriority']
+        self.idlepriority_slot = self.__index['idlepriority']
+        self.rotatepriority_slot = self.__index['rotatepriority']
+
+        self.child_slots = tuple(
+            (material, self.__index[f'{material_name}_childqtd'],
+             self.__index[f'{material_name}_childqtd_min_to_reproduce'])
+            for material_name, material in materials.materials.items()
+            if not material.ignore_for_child
+        )
+
+        self.energy_priority_slots = {
+            material: self.__index.get(f'{material.name}_energypriority')
+            for material in materials.energy_materials
+        }
+
+        self.convertion_rate_slots = tuple(
+            self.__index[f'{rule.name}_convertionrate']
+            for rule in material_rules
+        )
+
+        self.waste_slots = tuple(
+            (material, self.__index[f'{material.name}_waste_qtd_to_remove'])
+            for material in materials.waste_materials
+        )
+
+    def index(self, name):
+        return self.__index[name]
+
+    def vectorFromDict(self, traits):
+
+        missing = [name for name in self.__names if name not in traits]
+        if missing:
+            raise KeyError(f'Missing creature traits: {", ".join(missing)}')
+
+        return tuple(
+            (int(traits[name]) if is_integer else traits[name])
+            for name, is_integer in zip(self.__names, self.__integer)
+        )
+
+    def vectorToDict(self, vector):
+        return dict(zip(self.__names, vector))
+
+    @property
+    def traits(self):
+        return self.__traits
+
+    @property
+    def names(self):
+        return self.__names
+
+    def __len__(self):
+        return len(self.__traits)
+
 CREATURE_BASE_TRAITS = [
 
     CreatureTrait('speed', 0, 1),
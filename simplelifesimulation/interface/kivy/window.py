@@ -25,6 +25,10 @@ class Window(App):
     def step(self, _dt):
         self.__simulation.step()
 
+        tracer = self.__simulation.tracer
+        if tracer is not None:
+            start = tracer.clock()
+
         self.__widget.canvas.clear()
 
         with self.__widget.canvas:
@@ -33,6 +37,9 @@ class Window(App):
                                        self.__simulation.creatures):
                 obj.draw(self.__painter)
 
+        if tracer is not None:
+            tracer.span('render', start)
+
     def build(self):
 
         KivyWindow.clearcolor = (1, 1, 1, 1)
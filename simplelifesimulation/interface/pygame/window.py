@@ -68,12 +68,20 @@ class Window:
         pygame.display.set_caption('Simulation')
 
         self.__processEvents()
+
+        tracer = self.__simulation.tracer
+        if tracer is not None:
+            start = tracer.clock()
+
         self._screen.fill((100, 100, 100) if self.__use_wall is True
                           else (255, 255, 255))
         self.__drawObjects()
         self.__drawSideInfo()
         pygame.display.flip()
 
+        if tracer is not None:
+            tracer.span('render', start)
+
         self._clock.tick(self._ticks)
 
     def run(self):
@@ -1,21 +1,78 @@
+from math import ceil
 
-from math import sqrt, ceil
-
+import numpy
 import pymunk
 
 from ..simulation.simulationobject import CircleSimulationObject
 from ..simulation.collisiontypes import RESOURCE_COLLISION_TYPE
 
 from ..creatures.materials.material import MaterialsGroup
+from ..creatures.store import MaterialsStore
+
+class MeatStore(MaterialsStore):
+
+    RADIUS_TOLERANCE = 0.05
+
+    def __init__(self, materials_config,
+                 capacity=MaterialsStore.INITIAL_CAPACITY):
+
+        self.radius = numpy.zeros(0)
+        self.decomposed = numpy.zeros(0)
+
+        super().__init__(materials_config, capacity)
+
+        self.__decomposition_rate = self.materialVector('decomposition_rate')
+
+    def _columns(self):
+        return super()._columns() + ('radius', 'decomposed')
+
+    def decompose(self, ticks=1):
+
+        slots = self.slots
+        if len(slots) == 0:
+            return [], []
+
+        materials = self.materials[slots]
+
+        rate = 1 - (1 - self.__decomposition_rate)**ticks
+        decomposed = numpy.clip(numpy.ceil(materials*rate), 0, None)
+        decomposed = numpy.minimum(decomposed, numpy.clip(materials, 0, None))
+
+        materials -= decomposed
+        self.materials[slots] = materials
+        self.decomposed[slots] += decomposed @ self.mass_vector
+
+        empty = materials @ self.mass_vector <= 0
+
+        radius = numpy.sqrt(numpy.clip(
+            materials @ self.volume_vector, 0, None)*
+                            MaterialsGroup.MASS_MULTIPLIER)
+        resized = ~empty & (numpy.abs(radius - self.radius[slots]) >
+                            MeatStore.RADIUS_TOLERANCE*self.radius[slots])
+
+        return ([self.getObject(slot) for slot in slots[empty]],
+                [(self.getObject(slot), new_radius) for slot, new_radius in
+                 zip(slots[resized], radius[resized])])
 
 class Meat(CircleSimulationObject):
 
     def __init__(self, space, *args, **kwargs):
 
         self.__config = kwargs.pop('materials_config', None)
+        materials = kwargs.pop('materials', None)
+        self.__store = kwargs.pop('store', None)
+
+        if self.__store is None:
+            self.__store = MeatStore(self.__config)
+
+        self.__slot = self.__store.allocate(self)
+
+        if materials is not None:
+            self.__store.setMaterials(self.__slot, materials)
+
         self.__materials = MaterialsGroup(
-            kwargs.pop('materials', None), self.__config)
-        self.__decomposed = 0
+            self.__store.materialsView(self.__slot), self.__config,
+            copy=False)
 
         if len(args) == 1 and not kwargs:
 
@@ -23,12 +80,21 @@ class Meat(CircleSimulationObject):
 
             resource_info = info.get('meat', {})
 
-            self.__materials = resource_info.get('materials')
+            for material, qtd in resource_info.get('materials', {}).items():
+                material = self.__config.materials.get(material)
+                if material is not None:
+                    self.__materials[material] = qtd
 
             super().__init__(space, info)
+
+            self.shape.collision_type = RESOURCE_COLLISION_TYPE
+            self.shape.filter = pymunk.ShapeFilter(
+                categories=(1 << (RESOURCE_COLLISION_TYPE - 1)))
         else:
             self.__construct(space, *args, **kwargs)
 
+        self.__store.radius[self.__slot] = self.shape.radius
+
     def __construct(self, space, x, y):
 
         super().__init__(space, 1e8, self.__materials.radius, x, y)
@@ -41,23 +107,36 @@ class Meat(CircleSimulationObject):
     def materials_mass(self):
         return self.__materials.mass
 
+    @property
+    def decomposed(self):
+        return self.__store.decomposed.item(self.__slot)
+
     def merge(self, other):
         return MaterialsGroup({})
 
-    def step(self, simulation):
-        for material, qtd in self.__materials.items():
+    def mergeAll(self, others):
+
+        store = self.__store
+
+        for other in others:
+
+            self.__materials.merge(other.__materials)
+            store.decomposed[self.__slot] += other.decomposed
 
-            diff_qtd = Math.ceil(material.decomposition_rate*qtd)
+            other.__store.materials[other.__slot] = 0
 
-            self.__materials[material] -= diff_qtd
-            self.__decomposed += diff_qtd*material.mass
+        self.setRadius(self.__materials.radius)
 
-    def consume(self, _simulation, quantity):
+    def setRadius(self, radius):
+        self.shape.unsafe_set_radius(radius)
+        self.__store.radius[self.__slot] = radius
+
+    def consume(self, simulation, quantity):
 
         base_mass = self.__materials.base_mass
 
-        if base_mass == 0:
-            return
+        if base_mass <= 0:
+            return MaterialsGroup({})
 
         mult = quantity/base_mass
 
@@ -75,12 +154,21 @@ class Meat(CircleSimulationObject):
             if undigested_material is None:
                 undigested_material = material
 
-            consumed_materials[undigested_material] = removed_qtd
+            consumed_materials[undigested_material] = \
+                consumed_materials.get(undigested_material, 0) + removed_qtd
+
+        if self.__materials.base_mass <= 0:
+            simulation.delMeatResource(self)
 
-        self.shape.unsafe_set_radius(self.__materials.radius)
+        self.setRadius(self.__materials.radius)
 
         return MaterialsGroup(consumed_materials)
 
+    def destroy(self, space_objects=None):
+        if not self.destroyed:
+            super().destroy(space_objects=space_objects)
+            self.__store.release(self.__slot)
+
     def draw(self, painter, color=(255, 100, 100)):
         if self.shape.radius > 0:
             super().draw(painter, color)
@@ -90,7 +178,7 @@ class Meat(CircleSimulationObject):
         base_dict = super().toDict()
 
         base_dict['meat'] = {
-            'materials': self.__materials.getSerializable()
+            'materials': self.__materials.getSerializable
         }
 
         return base_dict
@@ -13,6 +13,7 @@ class Plant(CircleSimulationObject):
     def __init__(self, space, *args, **kwargs):
 
         self.__materials_config = kwargs.pop('materials_config', None)
+        tick = kwargs.pop('tick', 0)
 
         if len(args) == 1 and not kwargs:
 
@@ -23,12 +24,19 @@ class Plant(CircleSimulationObject):
             self._ext_rsc = resource_info.get('internal', 0)
             self._int_rsc = resource_info.get('external', 0)
             self.__convert_interval = resource_info.get('convert-interval', 0)
-            self.__steps_to_convert = resource_info.get(
-                'ticks-to-convert', 2000)
+            self.__convert_tick = resource_info.get('convert-tick')
+            if self.__convert_tick is None:
+                self.__convert_tick = tick + resource_info.get(
+                    'ticks-to-convert', 2000)
+            self.__convert_rsc_qtd = 0.1
 
             super().__init__(space, info)
+
+            self.shape.collision_type = RESOURCE_COLLISION_TYPE
+            self.shape.filter = pymunk.ShapeFilter(
+                categories=(1 << (RESOURCE_COLLISION_TYPE - 1)))
         else:
-            self.__construct(space, *args, **kwargs)
+            self.__construct(space, *args, tick=tick, **kwargs)
 
     @property
     def internal_resources(self):
@@ -38,6 +46,14 @@ class Plant(CircleSimulationObject):
     def external_resources(self):
         return self._ext_rsc
 
+    @property
+    def depleted(self):
+        return self._int_rsc <= 0 and self._ext_rsc <= 0
+
+    @property
+    def convert_tick(self):
+        return self.__convert_tick
+
     def merge(self, other):
 
         if not isinstance(other, Plant):
@@ -46,20 +62,30 @@ class Plant(CircleSimulationObject):
         if other._ext_rsc > self._ext_rsc:
             return other.merge(self)
 
-        self._ext_rsc += other._ext_rsc
-        self._int_rsc += other._int_rsc
+        self.mergeAll((other,))
+
+        return self
+
+    def mergeAll(self, others):
 
-        other._ext_rsc = other._int_rsc = 0
+        for other in others:
 
-        self.__steps_to_convert = min(self.__steps_to_convert,
-                                      other.__steps_to_convert)
+            self._ext_rsc += other._ext_rsc
+            self._int_rsc += other._int_rsc
+
+            other._ext_rsc = other._int_rsc = 0
+
+            self.__convert_tick = min(self.__convert_tick,
+                                      other.__convert_tick)
 
         self.shape.unsafe_set_radius(self.__getRadius())
 
-        return self
+    def deposit(self, quantity):
+        self._ext_rsc += quantity
+        self.shape.unsafe_set_radius(self.__getRadius())
 
     def __construct(self, space, x, y, external_rsc, internal_rsc,
-                    rsc_density=10, convert_interval=2000):
+                    rsc_density=10, convert_interval=2000, tick=0):
 
         self._ext_rsc = external_rsc
         self._int_rsc = internal_rsc
@@ -71,30 +97,26 @@ class Plant(CircleSimulationObject):
             categories=(1 << (RESOURCE_COLLISION_TYPE - 1)))
 
         self.__convert_interval = convert_interval
-        self.__steps_to_convert = self.__convert_interval
+        self.__convert_tick = tick + self.__convert_interval
         self.__convert_rsc_qtd = 0.1
 
-    def step(self, simulation):
+    def grow(self, tick):
 
-        if self.__steps_to_convert > 0:
-            self.__steps_to_convert -= 1
-        else:
-            if self._int_rsc > 0:
-                convert_quantity = self.__convert_rsc_qtd*self._ext_rsc
-                if self._int_rsc < convert_quantity:
-                    self._ext_rsc += self._int_rsc
-                    self._int_rsc = 0
-                else:
-                    self._int_rsc -= convert_quantity
-                    self._ext_rsc += convert_quantity
-                self.shape.unsafe_set_radius(self.__getRadius())
+        if self._int_rsc > 0:
+            convert_quantity = self.__convert_rsc_qtd*self._ext_rsc
+            if self._int_rsc < convert_quantity:
+                self._ext_rsc += self._int_rsc
+                self._int_rsc = 0
+            else:
+                self._int_rsc -= convert_quantity
+                self._ext_rsc += convert_quantity
+            self.shape.unsafe_set_radius(self.__getRadius())
 
-            self.__steps_to_convert = self.__convert_interval
+        self.__convert_tick = tick + self.__convert_interval
 
-        if self._int_rsc <= 0 and self._ext_rsc <= 0:
-            simulation.delResource(self)
+        return self.__convert_tick
 
-    def consume(self, _simulation, quantity):
+    def consume(self, simulation, quantity):
 
         quantity = int(quantity)
 
@@ -105,6 +127,10 @@ class Plant(CircleSimulationObject):
             new_radius = self.__getRadius()
             if new_radius != self.shape.radius:
                 self.shape.unsafe_set_radius(new_radius)
+
+            if self.depleted:
+                simulation.delResource(self)
+
             return MaterialsGroup({
                 self.__materials_config.plant_material: consumed
             })
@@ -132,7 +158,7 @@ class Plant(CircleSimulationObject):
         base_dict['plant'] = {
             'internal': self._ext_rsc,
             'external': self._int_rsc,
-            'ticks-to-convert': self.__steps_to_convert,
+            'convert-tick': self.__convert_tick,
             'convert-interval': self.__convert_interval
         }
 
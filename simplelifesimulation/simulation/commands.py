@@ -0,0 +1,48 @@
+class CommandBuffer:
+
+    def __init__(self):
+
+        self.__spawns = []
+        self.__despawns = []
+        self.__despawning = set()
+
+    def spawn(self, factory, *args, **kwargs):
+        self.__spawns.append((factory, args, kwargs))
+
+    def despawn(self, registry, entity):
+
+        if entity in self.__despawning or entity not in registry:
+            return False
+
+        self.__despawning.add(entity)
+        self.__despawns.append((registry, entity))
+
+        return True
+
+    def isDespawning(self, entity):
+        return entity in self.__despawning
+
+    def apply(self, space):
+
+        despawns = self.__despawns
+        spawns = self.__spawns
+
+        self.__despawns = []
+        self.__spawns = []
+        self.__despawning = set()
+
+        space_objects = []
+        for registry, entity in despawns:
+            registry.remove(entity)
+            entity.destroy(space_objects=space_objects)
+
+        if space_objects:
+            space.remove(*space_objects)
+
+        for factory, args, kwargs in spawns:
+            factory(*args, **kwargs)
+
+        return len(spawns), len(despawns)
+
+    def __len__(self):
+        return len(self.__spawns) + len(self.__despawns)
@@ -0,0 +1,56 @@
+import pymunk
+
+from .simulationobject import SimulationObject
+from .collisiontypes import (
+    CREATURE_COLLISION_TYPE, RESOURCE_COLLISION_TYPE, WALL_COLLISION_TYPE
+)
+
+class Ghost(SimulationObject):
+
+    def __init__(self, space, is_creature, x, y, radius, mass):
+
+        body = pymunk.Body(mass, pymunk.moment_for_circle(mass, 0, radius))
+        shape = pymunk.Circle(body, radius, (0, 0))
+
+        if is_creature:
+            shape.collision_type = CREATURE_COLLISION_TYPE
+            shape.filter = pymunk.ShapeFilter(
+                categories=(1 << (CREATURE_COLLISION_TYPE - 1)),
+                mask=(pymunk.ShapeFilter.ALL_MASKS ^
+                      (1 << (RESOURCE_COLLISION_TYPE - 1)) ^
+                      (1 << (WALL_COLLISION_TYPE - 1))))
+        else:
+            shape.collision_type = RESOURCE_COLLISION_TYPE
+            shape.filter = pymunk.ShapeFilter(
+                categories=(1 << (RESOURCE_COLLISION_TYPE - 1)))
+
+        super().__init__(space, body, shape, x, y)
+
+        self.__is_creature = is_creature
+
+    def update(self, x, y, radius, mass, velocity, angle):
+
+        body = self.body
+        body.position = x, y
+        body.velocity = velocity
+        body.angular_velocity = 0
+        body.angle = angle
+
+        if radius != self.shape.radius:
+            self.shape.unsafe_set_radius(radius)
+
+        if mass != body.mass:
+            body.mass = mass
+            body.moment = pymunk.moment_for_circle(mass, 0, radius)
+
+    @property
+    def is_creature(self):
+        return self.__is_creature
+
+    @property
+    def id_(self):
+        return -1
+
+    def draw(self, painter, color=(160, 160, 160)):
+        painter.drawCircle(color, self.body.position, self.shape.radius,
+                           width=1)
@@ -0,0 +1,140 @@
+from abc import ABC, abstractmethod
+import json
+import time
+import sys
+
+class HeadlessRunner(ABC):
+
+    REPORT_FORMAT = ('tick {tick}: {ticks_per_second:.1f} ticks/s, '
+                     '{creatures} creatures, {species} species, '
+                     '{plants} plants, {meats} meats')
+
+    @abstractmethod
+    def _currentTick(self):
+        pass
+
+    @abstractmethod
+    def _advance(self, limit, reporting):
+        pass
+
+    def _reportQuiet(self):
+        return False
+
+    def _finishRun(self):
+        pass
+
+    @abstractmethod
+    def summary(self):
+        pass
+
+    @abstractmethod
+    def save(self):
+        pass
+
+    def _reportSummary(self, ticks_per_second, final):
+
+        summary = self.summary()
+        summary['ticks_per_second'] = ticks_per_second
+        summary['final'] = final
+
+        return summary
+
+    def runHeadless(self, max_ticks=None, max_time=None, report_interval=1000,
+                    report_file=None):
+
+        report_output = None
+        if report_file is not None:
+            report_output = open(report_file, 'w')
+
+        start_time = last_report_time = time.perf_counter()
+        start_tick = last_report_tick = self._currentTick()
+
+        try:
+            while True:
+
+                current_tick = self._currentTick()
+
+                if max_ticks is not None and \
+                    current_tick - start_tick >= max_ticks:
+                    break
+
+                if max_time is not None and \
+                    time.perf_counter() - start_time >= max_time:
+                    break
+
+                limit = None
+                if max_ticks is not None:
+                    limit = start_tick + max_ticks - current_tick
+
+                next_report = None
+                if report_interval:
+                    next_report = report_interval - \
+                        (current_tick - start_tick)%report_interval
+                    if limit is None or next_report <= limit:
+                        limit = next_report
+
+                self._advance(limit, next_report is not None and
+                              limit == next_report)
+
+                current_tick = self._currentTick()
+
+                if report_interval and \
+                    (current_tick - start_tick)%report_interval == 0:
+
+                    now = time.perf_counter()
+                    self._report(report_output,
+                                 (current_tick - last_report_tick)/
+                                 (now - last_report_time))
+                    last_report_time = now
+                    last_report_tick = current_tick
+
+        except KeyboardInterrupt:
+            pass
+        finally:
+            elapsed = time.perf_counter() - start_time
+
+            self._finishRun()
+            summary = self._report(
+                report_output,
+                (self._currentTick() - start_tick)/elapsed if elapsed else 0,
+                final=True)
+
+            if report_output is not None:
+                report_output.close()
+
+            self.save()
+
+        return summary
+
+    def _report(self, output, ticks_per_second, final=False):
+
+        summary = self._reportSummary(ticks_per_second, final)
+
+        if output is not None:
+            output.write(json.dumps(summary) + '\n')
+            output.flush()
+
+        if not self._reportQuiet() or final:
+            print(self.REPORT_FORMAT.format(**summary), file=sys.stdout,
+                  flush=True)
+
+            stats = summary.get('stats')
+            if stats is not None:
+                HeadlessRunner.__printStats(stats)
+
+        return summary
+
+    @staticmethod
+    def __printStats(stats):
+
+        phases = sorted(stats['phases'].items(),
+                        key=lambda item: -item[1]['time'])
+        print('  ms/tick: ' + ', '.join(
+            f"{phase} {1000*info['time']:.3f}"
+            for phase, info in phases), file=sys.stdout, flush=True)
+
+        collisions = sorted(stats['collisions'].items(),
+                            key=lambda item: -item[1]['time'])
+        print('  collisions/tick: ' + ', '.join(
+            f"{handler} {info['calls']:.1f} calls {1000*info['time']:.3f}ms"
+            for handler, info in collisions), file=sys.stdout, flush=True)
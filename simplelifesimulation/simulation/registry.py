@@ -0,0 +1,47 @@
+class EntityRegistry:
+
+    def __init__(self, entities=()):
+
+        self.__entities = []
+        self.__index = {}
+
+        for entity in entities:
+            self.add(entity)
+
+    def add(self, entity):
+
+        if entity in self.__index:
+            return False
+
+        self.__index[entity] = len(self.__entities)
+        self.__entities.append(entity)
+
+        return True
+
+    def remove(self, entity):
+
+        index = self.__index.pop(entity, None)
+        if index is None:
+            return False
+
+        last_entity = self.__entities.pop()
+        if last_entity is not entity:
+            self.__entities[index] = last_entity
+            self.__index[last_entity] = index
+
+        return True
+
+    def snapshot(self):
+        return tuple(self.__entities)
+
+    def __contains__(self, entity):
+        return entity in self.__index
+
+    def __iter__(self):
+        return iter(self.__entities)
+
+    def __len__(self):
+        return len(self.__entities)
+
+    def __getitem__(self, index):
+        return self.__entities[index]
@@ -0,0 +1,43 @@
+class PhaseScheduler:
+
+    PHASES = ('physics', 'metabolism', 'decisions', 'plant_growth',
+              'plant_merge', 'meat_decay', 'meat_merge', 'saving')
+
+    DEFAULT_PERIODS = {
+        'physics': 1,
+        'metabolism': 1,
+        'decisions': 1,
+        'plant_growth': 1,
+        'plant_merge': 100,
+        'meat_decay': 10,
+        'meat_merge': 50,
+        'saving': 1000
+    }
+
+    def __init__(self, periods=None):
+
+        self.__periods = dict(PhaseScheduler.DEFAULT_PERIODS)
+
+        for phase, period in (periods or {}).items():
+            self.setPeriod(phase, period)
+
+    def setPeriod(self, phase, period):
+
+        if phase not in self.__periods:
+            raise ValueError(f'Unknown simulation phase {phase}')
+
+        period = int(period)
+        if period < 1:
+            raise ValueError(f'Period of phase {phase} must be at least 1')
+
+        self.__periods[phase] = period
+
+    def period(self, phase):
+        return self.__periods[phase]
+
+    def due(self, phase, tick):
+        return tick%self.__periods[phase] == 0
+
+    @property
+    def periods(self):
+        return dict(self.__periods)
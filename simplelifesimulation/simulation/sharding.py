@@ -0,0 +1,400 @@
+import multiprocessing
+import random
+import json
+
+from .simulation import Simulation
+from .headless import HeadlessRunner
+from .scheduler import PhaseScheduler
+
+from ..config import loadCreatureConfig
+from ..creatures.species import Species
+
+ENTITY_KINDS = ('creatures', 'resources', 'meats')
+
+def shardBounds(index, shards, width):
+    return index*width/shards, (index + 1)*width/shards
+
+def shardIndex(x, shards, width):
+    return min(max(int(x*shards/width), 0), shards - 1)
+
+def spawnWeights(shards):
+    return [max(0, min(0.9, (index + 1)/shards) - max(0.1, index/shards))
+            for index in range(shards)]
+
+def splitQuantity(quantity, weights):
+
+    total = sum(weights)
+    shares = [quantity*weight/total for weight in weights]
+    counts = [int(share) for share in shares]
+
+    remainders = sorted(range(len(shares)),
+                        key=lambda i: counts[i] - shares[i])
+    for i in remainders[:quantity - sum(counts)]:
+        counts[i] += 1
+
+    return counts
+
+def __shardEntities(simulation):
+    return ((simulation.creatures, simulation.delCreature, 'creatures'),
+            (simulation.plant_resources, simulation.delResource, 'resources'),
+            (simulation.meat_resources, simulation.delMeatResource, 'meats'))
+
+def __emigrate(simulation, index, shards):
+
+    width = simulation.size[0]
+    migrants = {}
+
+    for entities, delete, kind in __shardEntities(simulation):
+        for entity in tuple(entities):
+
+            owner = shardIndex(entity.body.position.x, shards, width)
+            if owner == index:
+                continue
+
+            content = migrants.get(owner)
+            if content is None:
+                content = migrants[owner] = {
+                    'species': {}, 'creatures': [], 'resources': [],
+                    'meats': []
+                }
+
+            if kind == 'creatures':
+                species = entity.species
+                content['species'][species.name] = species.toDict()
+
+            content[kind].append(entity.toDict())
+            delete(entity)
+
+    for content in migrants.values():
+        content['species'] = list(content['species'].values())
+
+    return migrants
+
+def __halo(simulation, index, shards, halo_width):
+
+    min_x, max_x = shardBounds(index, shards, simulation.size[0])
+    halo = {}
+
+    for entities, _, kind in __shardEntities(simulation):
+        for entity in entities:
+
+            x, y = entity.body.position
+
+            if x < min_x + halo_width and index > 0:
+                neighbour = index - 1
+            elif x >= max_x - halo_width and index < shards - 1:
+                neighbour = index + 1
+            else:
+                continue
+
+            halo.setdefault(neighbour, []).append((
+                (index, id(entity)), kind == 'creatures', x, y,
+                entity.shape.radius, entity.body.mass,
+                tuple(entity.body.velocity), entity.body.angle))
+
+    return halo
+
+def __dropForeign(simulation, index, shards):
+
+    width = simulation.size[0]
+
+    for entities, delete, _ in __shardEntities(simulation):
+        for entity in tuple(entities):
+            if shardIndex(entity.body.position.x, shards, width) != index:
+                delete(entity)
+
+def runShard(connection, index, shards, config, simulation_kwargs,
+             halo_width, seed):
+
+    Species.setNamePrefix(f'{index}:')
+
+    creature_config, initial_materials = loadCreatureConfig(**config)
+
+    in_file = simulation_kwargs.pop('in_file', None)
+    population_size = simulation_kwargs.pop('population_size', 0)
+    starting_resources = simulation_kwargs.pop('starting_resources', 0)
+    spawn_area = simulation_kwargs.pop('spawn_area')
+
+    if in_file is not None:
+        population_size = starting_resources = 0
+
+    simulation = Simulation(
+        population_size=population_size,
+        starting_resources=starting_resources, in_file=in_file,
+        use_graphic=False, quiet=True, creature_config=creature_config,
+        creature_materials_start=initial_materials,
+        spawn_area=spawn_area,
+        seed=None if seed is None else f'{seed}:{index}',
+        first_creature_id=index*ShardedSimulation.ID_STRIDE,
+        creature_id_limit=(index + 1)*ShardedSimulation.ID_STRIDE,
+        **simulation_kwargs)
+
+    __dropForeign(simulation, index, shards)
+
+    connection.send(simulation.size)
+
+    while True:
+
+        message = connection.recv()
+        command = message[0]
+
+        if command == 'step':
+
+            _, ticks, migrants, ghosts, with_species = message
+
+            simulation.loadEntities(migrants)
+            simulation.setGhosts(ghosts)
+
+            for _ in range(ticks):
+                simulation.step()
+
+            summary = simulation.summary()
+            if with_species:
+                summary['species'] = list({
+                    creature.species.name
+                    for creature in simulation.creatures})
+
+            connection.send((__emigrate(simulation, index, shards),
+                             __halo(simulation, index, shards, halo_width),
+                             summary))
+
+        elif command == 'save':
+            connection.send({
+                'species': [species.toDict()
+                            for species in Species.getAllSpecies()],
+                'resources': [rsc.toDict()
+                              for rsc in simulation.plant_resources],
+                'creatures': [creature.toDict()
+                              for creature in simulation.creatures],
+                'meats': [meat.toDict() for meat in simulation.meat_resources]
+            })
+
+        elif command == 'close':
+            break
+
+    connection.close()
+
+class ShardedSimulation(HeadlessRunner):
+
+    REPORT_FORMAT = HeadlessRunner.REPORT_FORMAT + \
+        ', {migrants} migrants, {ghosts} ghosts'
+
+    ID_STRIDE = 10**9
+
+    def __init__(self, shards=2, population_size=16, starting_resources=20,
+                 out_file=None, in_file=None, quiet=False, config=None,
+                 halo_width=100, exchange_period=5, seed=None,
+                 **simulation_kwargs):
+
+        if shards < 1:
+            raise ValueError('Number of shards must be at least 1')
+
+        if exchange_period < 1:
+            raise ValueError('Exchange period must be at least 1')
+
+        self.__shards = shards
+        self.__exchange_period = exchange_period
+        self.__out_file = out_file
+        self.__quiet = quiet
+
+        self.__save_period = PhaseScheduler(
+            simulation_kwargs.get('phase_periods')).period('saving')
+
+        if in_file is not None:
+            with open(in_file) as file:
+                self.__time = json.load(file).get('tick', 0)
+        else:
+            self.__time = 0
+
+        rng = random.Random(seed)
+
+        if not isinstance(population_size, int):
+            population_size = rng.randint(*population_size)
+
+        if not isinstance(starting_resources, int):
+            starting_resources = rng.randint(*starting_resources)
+
+        weights = spawnWeights(shards)
+        populations = splitQuantity(population_size, weights)
+        resources = splitQuantity(starting_resources, weights)
+
+        self.__connections = []
+        self.__processes = []
+
+        for index in range(shards):
+
+            min_x, max_x = shardBounds(index, shards, 1)
+
+            shard_kwargs = dict(simulation_kwargs)
+            shard_kwargs.update({
+                'population_size': populations[index],
+                'starting_resources': resources[index],
+                'in_file': in_file,
+                'spawn_area': (max(min_x, 0.1), 0.1, min(max_x, 0.9), 0.9)
+            })
+
+            connection, shard_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=runShard, daemon=True,
+                args=(shard_connection, index, shards, config or {},
+                      shard_kwargs, halo_width, seed))
+            process.start()
+
+            self.__connections.append(connection)
+            self.__processes.append(process)
+
+        self.__size = tuple(self.__connections[0].recv())
+        for connection in self.__connections[1:]:
+            connection.recv()
+
+        self.__migrants = [{} for _ in range(shards)]
+        self.__ghosts = [[] for _ in range(shards)]
+        self.__summary = {}
+
+        self.__exchange(0, False)
+
+    def __exchange(self, ticks, with_species):
+
+        for connection, migrants, ghosts in zip(
+                self.__connections, self.__migrants, self.__ghosts):
+            connection.send(('step', ticks, migrants, ghosts, with_species))
+
+        self.__migrants = [{} for _ in range(self.__shards)]
+        self.__ghosts = [[] for _ in range(self.__shards)]
+
+        summaries = []
+        for connection in self.__connections:
+
+            migrants, halo, summary = connection.recv()
+            summaries.append(summary)
+
+            for shard, content in migrants.items():
+                shard_migrants = self.__migrants[shard]
+                for kind, entities in content.items():
+                    shard_migrants.setdefault(kind, []).extend(entities)
+
+            for shard, ghosts in halo.items():
+                self.__ghosts[shard].extend(ghosts)
+
+        self.__time += ticks
+
+        self.__summary = {
+            'tick': self.__time,
+            'creatures': sum(summary['creatures'] for summary in summaries),
+            'species': len({name for summary in summaries
+                            for name in summary['species']})
+                       if with_species else self.__summary.get('species', 0),
+            'plants': sum(summary['plants'] for summary in summaries),
+            'meats': sum(summary['meats'] for summary in summaries),
+            'migrants': sum(len(entities)
+                            for migrants in self.__migrants
+                            for kind, entities in migrants.items()
+                            if kind in ENTITY_KINDS),
+            'ghosts': sum(len(ghosts) for ghosts in self.__ghosts)
+        }
+
+    def step(self, ticks=None, with_species=False):
+
+        if ticks is None:
+            ticks = self.__exchange_period
+
+        previous_time = self.__time
+
+        while ticks > 0:
+            exchange_ticks = min(ticks, self.__exchange_period)
+            self.__exchange(exchange_ticks, with_species and
+                            ticks == exchange_ticks)
+            ticks -= exchange_ticks
+
+        if self.__time//self.__save_period != \
+                previous_time//self.__save_period:
+            self.save()
+
+    def run(self, max_ticks=None, max_time=None, report_interval=1000,
+            report_file=None):
+        return self.runHeadless(max_ticks, max_time, report_interval,
+                                report_file)
+
+    def _currentTick(self):
+        return self.__time
+
+    def _advance(self, limit, reporting):
+
+        ticks = self.__exchange_period
+        if limit is not None:
+            ticks = min(ticks, limit)
+
+        self.step(ticks, with_species=reporting and ticks == limit)
+
+    def _reportQuiet(self):
+        return self.__quiet
+
+    def _finishRun(self):
+        self.__exchange(0, True)
+
+    def summary(self):
+        return dict(self.__summary)
+
+    def save(self):
+
+        if self.__out_file is None:
+            return
+
+        for connection in self.__connections:
+            connection.send(('save',))
+
+        species = {}
+        content = {kind: [] for kind in ENTITY_KINDS}
+
+        for connection in self.__connections:
+
+            shard_content = connection.recv()
+
+            for info in shard_content['species']:
+                known_info = species.get(info['name'])
+                if known_info is None or known_info['ancestor'] is None:
+                    species[info['name']] = info
+
+            for kind in ENTITY_KINDS:
+                content[kind].extend(shard_content[kind])
+
+        for migrants in self.__migrants:
+
+            for info in migrants.get('species', ()):
+                species.setdefault(info['name'], info)
+
+            for kind in ENTITY_KINDS:
+                content[kind].extend(migrants.get(kind, ()))
+
+        with open(self.__out_file, 'w') as file:
+            json.dump({
+                'size': self.__size,
+                'tick': self.__time,
+                'species': list(species.values()),
+                **content
+            }, file)
+
+    def close(self):
+
+        for connection in self.__connections:
+            connection.send(('close',))
+            connection.close()
+
+        for process in self.__processes:
+            process.join()
+
+    @property
+    def ticks(self):
+        return self.__time
+
+    @property
+    def size(self):
+        return self.__size
+
+    @property
+    def shards(self):
+        return self.__shards
+
+    @property
+    def exchange_period(self):
+        return self.__exchange_period
@@ -2,31 +2,61 @@
 import itertools
 import os
 import random
-from random import randint
 import json
 import importlib
 
 import pymunk
 
 from .simulationobject import SimulationObject
+from .registry import EntityRegistry
+from .commands import CommandBuffer
+from .scheduler import PhaseScheduler
+from .timerwheel import TimerWheel
+from .headless import HeadlessRunner
+from .stats import PhaseStats
+from .trace import Tracer
+from .ghost import Ghost
+from .spatialhash import SpatialHash, CellIndex, connectedGroups
+from .vision import EventVision, GridVision, ContactVision
 from .collisiontypes import (
     CREATURE_COLLISION_TYPE, SOUND_SENSOR_COLLISION_TYPE,
     VISION_SENSOR_COLLISION_TYPE, RESOURCE_COLLISION_TYPE, WALL_COLLISION_TYPE
 )
 
 from ..resources.plant import Plant
-from ..resources.meat import Meat
+from ..resources.meat import Meat, MeatStore
 
 from ..creatures.creature import Creature, Species
+from ..creatures.store import CreatureStore
+from ..creatures.materials.rule import ConvertionRulesEngine
 
-class Simulation:
+class PendingPlant:
+
+    def __init__(self, x, y, quantity):
+
+        self.x = x
+        self.y = y
+        self.quantity = quantity
+
+    def deposit(self, quantity):
+        self.quantity += quantity
+
+class Simulation(HeadlessRunner):
 
     def __init__(self, population_size=16, starting_resources=20, size=1000,
                  out_file=None, in_file=None, screen_size=None,
                  ticks_per_second=50, use_graphic=True, quiet=False,
                  creature_config=None, creature_materials_start=None,
                  use_wall=True, resource_convert_interval=2000,
-                 user_interface=None):
+                 user_interface=None, vectorized_convertion=True,
+                 phase_periods=None, sensing_period=1,
+                 grid_plant_merge=False, waste_deposit_radius=0,
+                 meat_merge_distance=None, spawn_area=None, seed=None,
+                 first_creature_id=0, creature_id_limit=None):
+
+        self.__seed = seed
+        self.__rng = random.Random(seed)
+        self.__last_creature_id = first_creature_id - 1
 
         self.__creature_config = creature_config
         self.__start_materials = creature_materials_start
@@ -44,6 +74,9 @@ class Simulation:
         else:
             in_file_content = None
 
+        self._time = 0 if in_file_content is None else \
+            in_file_content.get('tick', 0)
+
         if screen_size is None:
             screen_size = (600, 600)
 
@@ -65,7 +98,7 @@ class Simulation:
             self._resources_min = starting_resources[0]
             self._resources_max = starting_resources[1]
 
-        self.__ticks_to_save = 0
+        self.__scheduler = PhaseScheduler(phase_periods)
 
         self._quiet = quiet
 
@@ -88,108 +121,464 @@ class Simulation:
         else:
             self.__interface = None
 
-        self._time = 0
-
         self._space = pymunk.Space()
         self._space.damping = 0.25
         self._physics_steps_per_frame = 1
 
         self._dt = 1/15
 
-        handler = self._space.add_collision_handler(
-            CREATURE_COLLISION_TYPE, SOUND_SENSOR_COLLISION_TYPE)
-        handler.begin = self.__sensorAlert
+        self.__collision_handlers = []
+        self.__stats = None
+        self.__tracer = None
+        self.__instruments = None
 
-        handler = self._space.add_collision_handler(
-            CREATURE_COLLISION_TYPE, VISION_SENSOR_COLLISION_TYPE)
-        handler.begin = self.__visionAlert
+        self.__addCollisionHandler(
+            'sound', CREATURE_COLLISION_TYPE, SOUND_SENSOR_COLLISION_TYPE,
+            begin=self.__sensorAlert)
 
-        handler = self._space.add_collision_handler(
-            RESOURCE_COLLISION_TYPE, VISION_SENSOR_COLLISION_TYPE)
-        handler.begin = self.__resourceAlert
+        if creature_config.vision == 'grid':
+            self.__vision = GridVision(sensing_period)
+        elif creature_config.vision == 'circle':
+            self.__vision = ContactVision(sensing_period)
+        else:
+            self.__vision = EventVision(sensing_period)
+
+        if creature_config.vision == 'circle':
+            self.__addCollisionHandler(
+                'vision', CREATURE_COLLISION_TYPE,
+                VISION_SENSOR_COLLISION_TYPE, begin=self.__visionTouch,
+                separate=self.__visionSeparate)
+            self.__addCollisionHandler(
+                'resource_vision', RESOURCE_COLLISION_TYPE,
+                VISION_SENSOR_COLLISION_TYPE, begin=self.__visionTouch,
+                separate=self.__visionSeparate)
+        else:
+            self.__addCollisionHandler(
+                'vision', CREATURE_COLLISION_TYPE,
+                VISION_SENSOR_COLLISION_TYPE, begin=self.__visionAlert)
+            self.__addCollisionHandler(
+                'resource_vision', RESOURCE_COLLISION_TYPE,
+                VISION_SENSOR_COLLISION_TYPE, begin=self.__resourceAlert)
+
+        if grid_plant_merge:
+            self.__addCollisionHandler(
+                'resource_merge', RESOURCE_COLLISION_TYPE,
+                RESOURCE_COLLISION_TYPE, begin=self.__resourceOverlap)
+            self.__merge_hash = SpatialHash()
+        else:
+            self.__addCollisionHandler(
+                'resource_merge', RESOURCE_COLLISION_TYPE,
+                RESOURCE_COLLISION_TYPE, begin=self.__resourceMerge)
+            self.__merge_hash = None
 
-        handler = self._space.add_collision_handler(
-            RESOURCE_COLLISION_TYPE, RESOURCE_COLLISION_TYPE)
-        handler.begin = self.__resourceMerge
+        self.__addCollisionHandler(
+            'creature_resource', CREATURE_COLLISION_TYPE,
+            RESOURCE_COLLISION_TYPE, begin=self.__resourceCreatureTouch,
+            separate=self.__resourceCreatureSeparate)
 
-        handler = self._space.add_collision_handler(
-            CREATURE_COLLISION_TYPE, RESOURCE_COLLISION_TYPE)
-        handler.pre_solve = self.__resourceCreatureCollision
+        self.__eating_contacts = {}
 
-        handler = self._space.add_collision_handler(
-            CREATURE_COLLISION_TYPE, WALL_COLLISION_TYPE)
-        handler.pre_solve = self.__creatureWallCollision
+        self.__addCollisionHandler(
+            'wall', CREATURE_COLLISION_TYPE, WALL_COLLISION_TYPE,
+            pre_solve=self.__creatureWallCollision)
 
-        self._creatures = []
-        self._resources = []
-        self.__meat_rscs = []
+        self._creatures = EntityRegistry()
+        self._resources = EntityRegistry()
+        self.__meat_rscs = EntityRegistry()
+
+        self.__creature_store = CreatureStore(creature_config)
+        self.__meat_store = MeatStore(creature_config.materials)
+
+        self.__meat_merge_distance = meat_merge_distance
+        if meat_merge_distance is not None:
+            self.__meat_hash = SpatialHash()
+        else:
+            self.__meat_hash = None
+
+        self.__plant_growth = TimerWheel(tick=self._time)
+
+        self.__waste_deposit_radius = waste_deposit_radius
+        if waste_deposit_radius > 0:
+            self.__plant_index = CellIndex(max(waste_deposit_radius, 1))
+        else:
+            self.__plant_index = None
+
+        self.__commands = CommandBuffer()
+        self.__deferring = False
+
+        if vectorized_convertion and creature_config.material_rules:
+            self.__convertion_engine = ConvertionRulesEngine(
+                creature_config.material_rules,
+                self.__creature_store.material_list)
+        else:
+            self.__convertion_engine = None
+
+        self.__ghosts = {}
+        self.__ghost_creatures = ()
+        self.__ghost_resources = ()
+
+        if spawn_area is None:
+            spawn_area = (0.1, 0.1, 0.9, 0.9)
+        self.__spawn_area = spawn_area
 
         if in_file is None:
 
-            for _ in range(randint(self._population_size_min,
-                                self._population_size_max)):
-                self.newCreature(self._size[0]*(0.1 + 0.8*random.random()),
-                                 self._size[1]*(0.1 + 0.8*random.random()),
+            for _ in range(self.__rng.randint(self._population_size_min,
+                                              self._population_size_max)):
+                self.newCreature(*self.__randomPosition(),
                                  self.__start_materials)
 
             self.__generateResources()
         else:
-            for species in in_file_content.get('species', ()):
-                Species.loadFromDict(species)
+            self.loadEntities(in_file_content)
 
-            self._creatures = [
-                creature for creature in
-                (Creature.fromDict(self._space, creature)
-                for creature in in_file_content.get('creatures', ()))
-                if creature is not None
-            ]
-            self._resources = [
-                resource for resource in
-                (Resource.fromDict(self._space, resource)
-                for resource in in_file_content.get('resources', ()))
-                if resource is not None
-            ]
-            self.__meat_rscs = [
-                meat for meat in
-                (Meat.fromDict(self._space, meat)
-                for meat in in_file_content.get('meats', ()))
-                if meat is not None
-            ]
+            self.__last_creature_id = max(
+                (creature.id_ for creature in self._creatures
+                 if creature.id_ >= first_creature_id and
+                 (creature_id_limit is None or
+                  creature.id_ < creature_id_limit)),
+                default=self.__last_creature_id)
 
         if self.__use_wall is True:
             self.__addWalls()
 
     def __generateResources(self):
 
-        resources_qtd = randint(self._resources_min, self._resources_max)
+        resources_qtd = self.__rng.randint(self._resources_min,
+                                           self._resources_max)
         for _ in range(resources_qtd):
-            self.newResource(self._size[0]*(0.1 + 0.8*random.random()),
-                             self._size[1]*(0.1 + 0.8*random.random()),
-                             20000000, 0)
+            self.newResource(*self.__randomPosition(), 20000000, 0)
+
+    def __randomPosition(self):
+
+        min_x, min_y, max_x, max_y = self.__spawn_area
+
+        rng = self.__rng
+
+        return (self._size[0]*(min_x + (max_x - min_x)*rng.random()),
+                self._size[1]*(min_y + (max_y - min_y)*rng.random()))
+
+    def loadEntities(self, content):
+
+        for species in content.get('species', ()):
+            if Species.searchByName(species.get('name')) is None:
+                Species.loadFromDict(species)
+
+        for info in content.get('creatures', ()):
+            self._creatures.add(
+                Creature(self._space, info, config=self.__creature_config,
+                         store=self.__creature_store, rng=self.__rng))
+
+        for info in content.get('resources', ()):
+            resource = Plant(self._space, info,
+                             materials_config=self.__creature_config.materials,
+                             tick=self._time)
+            self._resources.add(resource)
+            self.__plant_growth.schedule(resource, resource.convert_tick)
+            if self.__plant_index is not None:
+                self.__plant_index.insert(resource, *resource.body.position)
+
+        for info in content.get('meats', ()):
+            self.__meat_rscs.add(
+                Meat(self._space, info,
+                     materials_config=self.__creature_config.materials,
+                     store=self.__meat_store))
+
+    def setGhosts(self, ghosts):
+
+        old_ghosts = self.__ghosts
+        new_ghosts = {}
+
+        for key, is_creature, x, y, radius, mass, velocity, angle in ghosts:
+
+            ghost = old_ghosts.pop(key, None)
+            if ghost is None:
+                ghost = Ghost(self._space, is_creature, x, y, radius, mass)
+
+            ghost.update(x, y, radius, mass, velocity, angle)
+            new_ghosts[key] = ghost
+
+        space_objects = []
+        for ghost in old_ghosts.values():
+            ghost.destroy(space_objects=space_objects)
+
+        if space_objects:
+            self._space.remove(*space_objects)
+
+        self.__ghosts = new_ghosts
+        self.__ghost_creatures = tuple(
+            ghost for ghost in new_ghosts.values() if ghost.is_creature)
+        self.__ghost_resources = tuple(
+            ghost for ghost in new_ghosts.values() if not ghost.is_creature)
 
     def step(self):
 
         for _ in range(self._physics_steps_per_frame):
 
-            self._space.step(self._dt)
+            tick = self._time + 1
+            stats = self.__instruments
+            tracer = self.__tracer
+
+            if tracer is not None:
+                creatures_before = len(self._creatures)
+                last_creature_id = self.__last_creature_id
+
+            self.__deferring = True
+            try:
+                self.__tick(tick, stats)
+            finally:
+                self.__deferring = False
+                self._time = tick
+
+                if stats is not None:
+                    start = stats.clock()
+
+                commands_applied = self.__commands.apply(self._space)
+
+                if stats is not None:
+                    stats.record('commands', start, sum(commands_applied))
 
-            for creature in self._creatures:
-                creature.act(self)
+            if tracer is not None:
+                births = self.__last_creature_id - last_creature_id
+                tracer.population(
+                    len(self._creatures), len(self._resources),
+                    len(self.__meat_rscs), births,
+                    births - len(self._creatures) + creatures_before)
 
-            for resource in self._resources:
-                resource.step(self)
+            if self.__scheduler.due('saving', tick):
+
+                if stats is not None:
+                    start = stats.clock()
 
-            self.__ticks_to_save -= 1
-            if self.__ticks_to_save <= 0:
-                self.__ticks_to_save = 1000
                 self.save()
 
-    def run(self):
+                if stats is not None:
+                    stats.record('saving', start)
+
+                if tracer is not None and self._out_file is not None:
+                    tracer.instant('save', {'tick': tick,
+                                            'file': self._out_file})
+
+            if stats is not None:
+                stats.endTick()
+
+    def __tick(self, tick, stats):
+
+        scheduler = self.__scheduler
+
+        if scheduler.due('physics', tick):
+
+            if stats is not None:
+                start = stats.clock()
+
+            self._space.step(self._dt*scheduler.period('physics'))
+
+            if stats is not None:
+                stats.record('physics', start)
+                start = stats.clock()
+
+            self.__eatContacts(scheduler.period('physics'))
+
+            if stats is not None:
+                stats.record('eating', start, len(self.__eating_contacts))
+
+        if stats is not None:
+            start = stats.clock()
+
+        self.__vision.sense(
+            self._creatures,
+            itertools.chain(self.resources, self.__ghost_resources), tick,
+            ghost_creatures=self.__ghost_creatures)
+
+        if stats is not None:
+            stats.record('vision', start, len(self._creatures))
+
+        metabolism_due = scheduler.due('metabolism', tick)
+        decisions_due = scheduler.due('decisions', tick)
+
+        if metabolism_due or decisions_due:
+
+            metabolism_ticks = scheduler.period('metabolism')
+            decisions_ticks = scheduler.period('decisions')
+
+            materials_converted = metabolism_due and \
+                self.__convertion_engine is not None
+            if materials_converted:
+
+                if stats is not None:
+                    start = stats.clock()
+
+                self.__creature_store.convertMaterials(
+                    self.__convertion_engine, metabolism_ticks)
+
+                if stats is not None:
+                    stats.record('convertion', start, len(self._creatures))
+
+            if stats is not None:
+                start = stats.clock()
+
+            creatures = self._creatures.snapshot()
+
+            for creature in creatures:
+
+                if metabolism_due and not creature.metabolize(
+                        self, ticks=metabolism_ticks,
+                        materials_converted=materials_converted):
+                    continue
+
+                if decisions_due:
+                    creature.behave(self, ticks=decisions_ticks)
+
+            if stats is not None:
+                stats.record('creatures', start, len(creatures))
+
+        if scheduler.due('plant_growth', tick):
+
+            if stats is not None:
+                start = stats.clock()
+
+            plant_growth = self.__plant_growth
+            grown = plant_growth.advance(tick)
+            for resource in grown:
+                plant_growth.schedule(resource, resource.grow(tick))
+
+            if stats is not None:
+                stats.record('plant_growth', start, len(grown))
+
+        if self.__merge_hash is not None and \
+                scheduler.due('plant_merge', tick):
+
+            if stats is not None:
+                start = stats.clock()
+
+            self.__mergePlants()
+
+            if stats is not None:
+                stats.record('plant_merge', start, len(self._resources))
+
+        if scheduler.due('meat_decay', tick):
+
+            if stats is not None:
+                start = stats.clock()
+
+            emptied, resized = self.__meat_store.decompose(
+                ticks=scheduler.period('meat_decay'))
+            for meat in emptied:
+                self.delMeatResource(meat)
+            for meat, radius in resized:
+                meat.setRadius(radius)
+
+            if stats is not None:
+                stats.record('meat_decay', start, len(self.__meat_rscs))
+
+        if self.__meat_hash is not None and \
+                scheduler.due('meat_merge', tick):
+
+            if stats is not None:
+                start = stats.clock()
+
+            self.__mergeMeats()
+
+            if stats is not None:
+                stats.record('meat_merge', start, len(self.__meat_rscs))
+
+    def enableStats(self, window=PhaseStats.DEFAULT_WINDOW, top_pairs=0):
+
+        if self.__stats is not None:
+            self.disableStats()
+
+        stats = self.__stats = PhaseStats(window, top_pairs)
+
+        for name, handler, callbacks in self.__collision_handlers:
+            for kind, callback in callbacks.items():
+                setattr(handler, kind, stats.timed(f'{name}.{kind}', callback))
+
+        self.__updateInstruments()
+
+        return stats
+
+    def disableStats(self):
+
+        for _, handler, callbacks in self.__collision_handlers:
+            for kind, callback in callbacks.items():
+                setattr(handler, kind, callback)
+
+        self.__stats = None
+        self.__updateInstruments()
+
+    @property
+    def stats(self):
+        return self.__stats
+
+    def enableTrace(self, filename, buffer_size=Tracer.DEFAULT_BUFFER_SIZE,
+                    burst_size=Tracer.DEFAULT_BURST_SIZE):
+
+        if self.__tracer is not None:
+            self.disableTrace()
+
+        tracer = self.__tracer = Tracer(filename, buffer_size, burst_size,
+                                        first_tick=self._time + 1)
+        self.__updateInstruments()
+
+        return tracer
+
+    def disableTrace(self):
+
+        if self.__tracer is not None:
+            self.__tracer.close()
+
+        self.__tracer = None
+        self.__updateInstruments()
+
+    @property
+    def tracer(self):
+        return self.__tracer
+
+    def __updateInstruments(self):
+
+        tracer = self.__tracer
+        if tracer is not None:
+            tracer.stats = self.__stats
+            self.__instruments = tracer
+        else:
+            self.__instruments = self.__stats
+
+    def run(self, max_ticks=None, max_time=None, report_interval=1000,
+            report_file=None):
         if self._use_graphic is True:
             self.__interface.run()
-        else:
-            while True:
-                self.step()
+            return None
+
+        return self.runHeadless(max_ticks, max_time, report_interval,
+                                report_file)
+
+    def _currentTick(self):
+        return self._time
+
+    def _advance(self, limit, reporting):
+        self.step()
+
+    def _reportQuiet(self):
+        return self._quiet
+
+    def _reportSummary(self, ticks_per_second, final):
+
+        summary = super()._reportSummary(ticks_per_second, final)
+
+        if self.__stats is not None:
+            summary['stats'] = self.__stats.summary()
+
+        return summary
+
+    def summary(self):
+        return {
+            'tick': self._time,
+            'creatures': len(self._creatures),
+            'species': len({creature.species for creature in
+                            self._creatures}),
+            'plants': len(self._resources),
+            'meats': len(self.__meat_rscs)
+        }
 
     def save(self):
 
@@ -199,6 +588,7 @@ class Simulation:
         with open(self._out_file, 'w') as file:
             json.dump({
                 'size': self._size,
+                'tick': self._time,
                 'species': [species.toDict() for species in
                             Species.getAllSpecies()],
                 'resources': [rsc.toDict() for rsc in self._resources],
@@ -206,6 +596,26 @@ class Simulation:
                 'meats': [meat.toDict() for meat in self.__meat_rscs],
             }, file)
 
+    @property
+    def ticks(self):
+        return self._time
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def seed(self):
+        return self.__seed
+
+    @property
+    def rng(self):
+        return self.__rng
+
+    @property
+    def scheduler(self):
+        return self.__scheduler
+
     @property
     def creatures(self):
         return self._creatures
@@ -222,27 +632,45 @@ class Simulation:
     def meat_resources(self):
         return self.__meat_rscs
 
+    @property
+    def ghosts(self):
+        return self.__ghosts.values()
+
     @property
     def creature_config(self):
         return self.__creature_config
 
+    @property
+    def creature_store(self):
+        return self.__creature_store
+
     def newCreature(self, x, y, materials=None, parent=None):
 
+        if self.__deferring:
+            self.__commands.spawn(self.newCreature, x, y, materials=materials,
+                                  parent=parent)
+            return None
+
         if materials is None:
             materials = self.__start_materials.copy()
 
+        self.__last_creature_id += 1
+
         creature = Creature(self._space, x, y, parent=parent,
-                            materials=materials, config=self.__creature_config)
+                            materials=materials, config=self.__creature_config,
+                            store=self.__creature_store, rng=self.__rng,
+                            id_=self.__last_creature_id)
 
-        self._creatures.append(creature)
+        self._creatures.add(creature)
 
         return creature
 
     def delCreature(self, creature):
 
-        try:
-            self._creatures.remove(creature)
-        except ValueError:
+        if self.__deferring:
+            return self.__commands.despawn(self._creatures, creature)
+
+        if not self._creatures.remove(creature):
             return False
 
         creature.destroy()
@@ -250,19 +678,55 @@ class Simulation:
 
     def newResource(self, x, y, ext_rsc, int_rsc):
 
+        if self.__deferring:
+            self.__commands.spawn(self.newResource, x, y, ext_rsc, int_rsc)
+            return None
+
         resource = Plant(self._space, x, y, ext_rsc, int_rsc,
                          convert_interval=self.__resource_convert_interval,
-                         materials_config=self.__creature_config.materials)
+                         materials_config=self.__creature_config.materials,
+                         tick=self._time)
 
-        self._resources.append(resource)
+        self._resources.add(resource)
+        self.__plant_growth.schedule(resource, resource.convert_tick)
+        if self.__plant_index is not None:
+            self.__plant_index.insert(resource, x, y)
 
         return resource
 
+    def depositWaste(self, x, y, quantity):
+
+        if self.__plant_index is not None:
+            plant = self.__plant_index.nearest(
+                x, y, self.__waste_deposit_radius)
+            if plant is not None:
+                plant.deposit(quantity)
+                return plant
+
+            if self.__deferring:
+                pending = PendingPlant(x, y, quantity)
+                self.__plant_index.insert(pending, x, y)
+                self.__commands.spawn(self.__spawnPendingPlant, pending)
+                return None
+
+        return self.newResource(x, y, quantity, 0)
+
+    def __spawnPendingPlant(self, pending):
+
+        self.__plant_index.remove(pending)
+
+        return self.newResource(pending.x, pending.y, pending.quantity, 0)
+
     def delResource(self, resource):
 
-        try:
-            self._resources.remove(resource)
-        except ValueError:
+        self.__plant_growth.cancel(resource)
+        if self.__plant_index is not None:
+            self.__plant_index.remove(resource)
+
+        if self.__deferring:
+            return self.__commands.despawn(self._resources, resource)
+
+        if not self._resources.remove(resource):
             return False
 
         resource.destroy()
@@ -270,23 +734,38 @@ class Simulation:
 
     def newMeatResource(self, x, y, materials):
 
+        if self.__deferring:
+            self.__commands.spawn(self.newMeatResource, x, y, materials)
+            return None
+
         resource = Meat(self._space, x, y, materials=materials,
-                        materials_config=self.__creature_config.materials)
+                        materials_config=self.__creature_config.materials,
+                        store=self.__meat_store)
 
-        self.__meat_rscs.append(resource)
+        self.__meat_rscs.add(resource)
 
         return resource
 
     def delMeatResource(self, resource):
 
-        try:
-            self.__meat_rscs.remove(resource)
-        except ValueError:
+        if self.__deferring:
+            return self.__commands.despawn(self.__meat_rscs, resource)
+
+        if not self.__meat_rscs.remove(resource):
             return False
 
         resource.destroy()
         return True
 
+    def __addCollisionHandler(self, name, first_type, second_type,
+                              **callbacks):
+
+        handler = self._space.add_collision_handler(first_type, second_type)
+        for kind, callback in callbacks.items():
+            setattr(handler, kind, callback)
+
+        self.__collision_handlers.append((name, handler, callbacks))
+
     @staticmethod
     def __sensorAlert(arbiter, _space, _):
 
@@ -295,37 +774,75 @@ class Simulation:
 
         return False
 
-    @staticmethod
-    def __visionAlert(arbiter, _space, _):
+    def __visionAlert(self, arbiter, _space, _):
 
         vision_creature = arbiter.shapes[0].simulation_object
-        arbiter.shapes[1].creature.visionAlert(vision_creature)
+        self.__vision.record(arbiter.shapes[1].creature, vision_creature, True)
 
         return False
 
-    @staticmethod
-    def __resourceAlert(arbiter, _space, _):
+    def __resourceAlert(self, arbiter, _space, _):
 
         vision_resource = arbiter.shapes[0].simulation_object
-        arbiter.shapes[1].creature.visionResourceAlert(vision_resource)
+        self.__vision.record(arbiter.shapes[1].creature, vision_resource,
+                             False)
 
         return False
 
-    def __resourceCreatureCollision(self, arbiter, _space, _):
+    def __visionTouch(self, arbiter, _space, _):
+
+        target_shape, sensor_shape = arbiter.shapes
+        self.__vision.touch(sensor_shape.creature,
+                            target_shape.simulation_object)
 
-        creature_shape = arbiter.shapes[0]
+        return True
+
+    def __visionSeparate(self, arbiter, _space, _):
+
+        target_shape, sensor_shape = arbiter.shapes
+        self.__vision.lose(sensor_shape.creature,
+                           target_shape.simulation_object)
+
+    def __resourceCreatureTouch(self, arbiter, _space, _):
+
+        creature_shape, resource_shape = arbiter.shapes
         creature = creature_shape.simulation_object
-        resource_shape = arbiter.shapes[1]
         resource = resource_shape.simulation_object
 
-        dis = creature.headposition.get_distance(resource.body.position)
-        if dis < 1.2*resource_shape.radius:
-            creature.eat(self, resource)
+        if isinstance(resource, Ghost):
+            return creature_shape.radius <= 2*resource_shape.radius
 
-        if creature_shape.radius > 2*resource_shape.radius:
-            return False
+        contacts = self.__eating_contacts.get(creature)
+        if contacts is None:
+            contacts = self.__eating_contacts[creature] = {}
+        contacts[resource] = None
 
-        return True
+        return creature_shape.radius <= 2*resource_shape.radius
+
+    def __resourceCreatureSeparate(self, arbiter, _space, _):
+
+        creature_shape, resource_shape = arbiter.shapes
+        creature = creature_shape.simulation_object
+
+        contacts = self.__eating_contacts.get(creature)
+        if contacts is None:
+            return
+
+        contacts.pop(resource_shape.simulation_object, None)
+        if not contacts:
+            del self.__eating_contacts[creature]
+
+    def __eatContacts(self, ticks):
+
+        for creature, contacts in tuple(self.__eating_contacts.items()):
+
+            head_position = creature.headposition
+
+            for resource in contacts:
+                if head_position.get_distance(resource.body.position) < \
+                        1.2*resource.shape.radius:
+                    creature.eat(self, resource, ticks)
+                    break
 
     @staticmethod
     def __creatureWallCollision(arbiter, _space, _):
@@ -336,15 +853,71 @@ class Simulation:
 
         return True
 
+    def __mergePlants(self):
+
+        commands = self.__commands
+        plants = [plant for plant in self._resources
+                  if not commands.isDespawning(plant)]
+
+        firsts, seconds = self.__merge_hash.overlaps(
+            [tuple(plant.body.position) for plant in plants],
+            [plant.shape.radius for plant in plants])
+
+        for group in connectedGroups(len(plants), firsts.tolist(),
+                                     seconds.tolist()):
+
+            group = [plants[i] for i in group]
+            new_rsc = max(group, key=lambda plant: plant.external_resources)
+            merged = [plant for plant in group if plant is not new_rsc]
+
+            new_rsc.mergeAll(merged)
+            self.__plant_growth.schedule(new_rsc, new_rsc.convert_tick)
+
+            for plant in merged:
+                self.delResource(plant)
+
+    def __mergeMeats(self):
+
+        commands = self.__commands
+        meats = [meat for meat in self.__meat_rscs
+                 if not commands.isDespawning(meat)]
+
+        firsts, seconds = self.__meat_hash.overlaps(
+            [tuple(meat.body.position) for meat in meats],
+            [meat.shape.radius + self.__meat_merge_distance/2
+             for meat in meats])
+
+        for group in connectedGroups(len(meats), firsts.tolist(),
+                                     seconds.tolist()):
+
+            group = [meats[i] for i in group]
+            new_rsc = max(group, key=lambda meat: meat.materials_mass)
+            merged = [meat for meat in group if meat is not new_rsc]
+
+            new_rsc.mergeAll(merged)
+
+            for meat in merged:
+                self.delMeatResource(meat)
+
     @staticmethod
-    def __resourceMerge(arbiter, _space, _):
+    def __resourceOverlap(_arbiter, _space, _):
+        return False
+
+    def __resourceMerge(self, arbiter, _space, _):
 
         shapes = arbiter.shapes
         rsc1 = shapes[0].simulation_object
         rsc2 = shapes[1].simulation_object
 
+        if isinstance(rsc1, Ghost) or isinstance(rsc2, Ghost):
+            return False
+
         new_rsc = rsc1.merge(rsc2)
 
+        if isinstance(new_rsc, Plant):
+            self.__plant_growth.schedule(new_rsc, new_rsc.convert_tick)
+            self.delResource(rsc2 if new_rsc is rsc1 else rsc1)
+
         return False
 
     def __addWalls(self):
@@ -40,12 +40,17 @@ class SimulationObject(ABC):
         self._space = space
         self.__destroyed = False
 
-    def destroy(self):
+    def destroy(self, space_objects=None):
         if self.__destroyed is False:
-            del self.shape.simulation_object
-            self._space.remove(self.shape, self.body)
+            if space_objects is None:
+                self._space.remove(*self._spaceObjects())
+            else:
+                space_objects.extend(self._spaceObjects())
             self.__destroyed = True
 
+    def _spaceObjects(self):
+        return (self.shape, self.body)
+
     @staticmethod
     def newBody(mass, inertia):
         return pymunk.Body(mass, inertia)
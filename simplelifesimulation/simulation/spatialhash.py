@@ -0,0 +1,182 @@
+from math import floor
+
+import numpy
+
+class SpatialHash:
+
+    DEFAULT_CELL_SIZE = 128
+
+    def __init__(self, cell_size=DEFAULT_CELL_SIZE):
+
+        if cell_size <= 0:
+            raise ValueError('Spatial hash cell size must be positive')
+
+        self.__cell_size = cell_size
+        self.__order = numpy.empty(0, dtype=int)
+        self.__keys = numpy.empty(0, dtype=numpy.int64)
+
+    @staticmethod
+    def __cellKeys(cell_xs, cell_ys):
+        return (cell_xs.astype(numpy.int64) << 32) + \
+            (cell_ys.astype(numpy.int64) + (1 << 31))
+
+    def rebuild(self, positions):
+
+        positions = numpy.asarray(positions, dtype=float).reshape(-1, 2)
+
+        cells = numpy.floor(positions/self.__cell_size)
+        keys = SpatialHash.__cellKeys(cells[:, 0], cells[:, 1])
+        order = numpy.argsort(keys, kind='stable')
+
+        self.__order = order
+        self.__keys = keys[order]
+
+    def query(self, x, y, radius):
+        return self.queryMany([x], [y], [radius])[1]
+
+    @staticmethod
+    def __expand(starts, counts):
+        return numpy.arange(counts.sum()) - numpy.repeat(
+            numpy.cumsum(counts) - counts - starts, counts)
+
+    def queryMany(self, xs, ys, radii):
+
+        xs = numpy.asarray(xs, dtype=float)
+        ys = numpy.asarray(ys, dtype=float)
+        radii = numpy.asarray(radii, dtype=float)
+
+        cell_size = self.__cell_size
+        keys = self.__keys
+
+        min_x = numpy.floor((xs - radii)/cell_size).astype(numpy.int64)
+        max_x = numpy.floor((xs + radii)/cell_size).astype(numpy.int64)
+        min_y = numpy.floor((ys - radii)/cell_size)
+        max_y = numpy.floor((ys + radii)/cell_size)
+
+        rows = max_x - min_x + 1
+        row_queries = numpy.repeat(numpy.arange(len(xs)), rows)
+        row_xs = SpatialHash.__expand(min_x, rows)
+
+        lows = numpy.searchsorted(
+            keys, SpatialHash.__cellKeys(row_xs, min_y[row_queries]), 'left')
+        highs = numpy.searchsorted(
+            keys, SpatialHash.__cellKeys(row_xs, max_y[row_queries]), 'right')
+
+        counts = highs - lows
+
+        return numpy.repeat(row_queries, counts), \
+            self.__order[SpatialHash.__expand(lows, counts)]
+
+    def overlaps(self, positions, radii):
+
+        positions = numpy.asarray(positions, dtype=float).reshape(-1, 2)
+        radii = numpy.asarray(radii, dtype=float)
+
+        if len(radii) == 0:
+            return numpy.empty(0, dtype=int), numpy.empty(0, dtype=int)
+
+        self.rebuild(positions)
+
+        firsts, seconds = self.queryMany(
+            positions[:, 0], positions[:, 1], radii + radii.max())
+
+        candidates = firsts < seconds
+        firsts = firsts[candidates]
+        seconds = seconds[candidates]
+
+        delta = positions[seconds] - positions[firsts]
+        overlapping = numpy.hypot(delta[:, 0], delta[:, 1]) < \
+            radii[firsts] + radii[seconds]
+
+        return firsts[overlapping], seconds[overlapping]
+
+    @property
+    def cell_size(self):
+        return self.__cell_size
+
+    def __len__(self):
+        return len(self.__order)
+
+class CellIndex:
+
+    def __init__(self, cell_size=SpatialHash.DEFAULT_CELL_SIZE):
+
+        if cell_size <= 0:
+            raise ValueError('Cell index cell size must be positive')
+
+        self.__cell_size = cell_size
+        self.__cells = {}
+        self.__entries = {}
+
+    def __cell(self, x, y):
+        return (floor(x/self.__cell_size), floor(y/self.__cell_size))
+
+    def insert(self, item, x, y):
+
+        self.remove(item)
+
+        cell = self.__cell(x, y)
+        self.__entries[item] = (cell, x, y)
+        self.__cells.setdefault(cell, {})[item] = (x, y)
+
+    def remove(self, item):
+
+        entry = self.__entries.pop(item, None)
+        if entry is None:
+            return False
+
+        cell = self.__cells[entry[0]]
+        del cell[item]
+        if not cell:
+            del self.__cells[entry[0]]
+
+        return True
+
+    def nearest(self, x, y, radius):
+
+        min_x, min_y = self.__cell(x - radius, y - radius)
+        max_x, max_y = self.__cell(x + radius, y + radius)
+
+        best_item = None
+        best_distance = radius*radius
+
+        cells = self.__cells
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                for item, (item_x, item_y) in cells.get(
+                        (cell_x, cell_y), {}).items():
+                    distance = (item_x - x)**2 + (item_y - y)**2
+                    if distance <= best_distance:
+                        best_item = item
+                        best_distance = distance
+
+        return best_item
+
+    def __contains__(self, item):
+        return item in self.__entries
+
+    def __len__(self):
+        return len(self.__entries)
+
+def connectedGroups(count, firsts, seconds):
+
+    parents = list(range(count))
+
+    def root(item):
+        while parents[item] != item:
+            parents[item] = parents[parents[item]]
+            item = parents[item]
+        return item
+
+    for first, second in zip(firsts, seconds):
+        first_root = root(first)
+        second_root = root(second)
+        if first_root != second_root:
+            parents[max(first_root, second_root)] = min(first_root,
+                                                        second_root)
+
+    groups = {}
+    for item in range(count):
+        groups.setdefault(root(item), []).append(item)
+
+    return [group for group in groups.values() if len(group) > 1]
@@ -0,0 +1,210 @@
+from collections import deque
+import heapq
+import time
+
+class PhaseStats:
+
+    DEFAULT_WINDOW = 100
+
+    def __init__(self, window=DEFAULT_WINDOW, top_pairs=0):
+
+        if window < 1:
+            raise ValueError('Stats window must be at least 1')
+
+        if top_pairs < 0:
+            raise ValueError('Number of top pairs can not be negative')
+
+        self.__history = deque(maxlen=window)
+        self.__totals = {}
+        self.__collision_totals = {}
+        self.__ticks = 0
+        self.__top_pairs = top_pairs
+
+        self.__times = {}
+        self.__entities = {}
+        self.__collisions = {}
+        self.__pairs = {}
+
+    @staticmethod
+    def clock():
+        return time.perf_counter()
+
+    def record(self, phase, start, entities=None):
+
+        times = self.__times
+        times[phase] = times.get(phase, 0) + time.perf_counter() - start
+
+        if entities is not None:
+            self.__entities[phase] = \
+                self.__entities.get(phase, 0) + entities
+
+    def timed(self, handler, function):
+
+        perf_counter = time.perf_counter
+        track_pairs = self.__top_pairs > 0
+
+        def callback(arbiter, space, data):
+
+            start = perf_counter()
+            result = function(arbiter, space, data)
+            elapsed = perf_counter() - start
+
+            collision = self.__collisions.get(handler)
+            if collision is None:
+                self.__collisions[handler] = [1, elapsed]
+            else:
+                collision[0] += 1
+                collision[1] += elapsed
+
+            if track_pairs:
+                first, second = arbiter.shapes
+                pair = (handler, PhaseStats.__shapeOwner(first),
+                        PhaseStats.__shapeOwner(second))
+                self.__pairs[pair] = self.__pairs.get(pair, 0) + 1
+
+            return result
+
+        return callback
+
+    @staticmethod
+    def __shapeOwner(shape):
+
+        creature = getattr(shape, 'creature', None)
+        if creature is not None:
+            return creature
+
+        return getattr(shape, 'simulation_object', None)
+
+    @staticmethod
+    def __ownerName(owner):
+
+        if owner is None:
+            return 'static'
+
+        id_ = getattr(owner, 'id_', None)
+        if id_ is not None and id_ >= 0:
+            return f'{type(owner).__name__} {id_}'
+
+        x, y = owner.body.position
+        return f'{type(owner).__name__} ({x:.0f}, {y:.0f})'
+
+    def endTick(self):
+
+        totals = self.__totals
+        for phase, elapsed in self.__times.items():
+            totals[phase] = totals.get(phase, 0) + elapsed
+
+        collision_totals = self.__collision_totals
+        for handler, (calls, elapsed) in self.__collisions.items():
+            total = collision_totals.get(handler)
+            if total is None:
+                collision_totals[handler] = [calls, elapsed]
+            else:
+                total[0] += calls
+                total[1] += elapsed
+
+        self.__history.append((self.__times, self.__entities,
+                               self.__collisions, self.__pairs))
+        self.__ticks += 1
+
+        self.__times = {}
+        self.__entities = {}
+        self.__collisions = {}
+        self.__pairs = {}
+
+    def reset(self):
+        self.__history.clear()
+        self.__totals = {}
+        self.__collision_totals = {}
+        self.__ticks = 0
+
+    @staticmethod
+    def __average(values, ticks):
+
+        sums = {}
+        for tick_values in values:
+            for key, value in tick_values.items():
+                sums[key] = sums.get(key, 0) + value
+
+        return {key: value/ticks for key, value in sums.items()}
+
+    def __collisionsSummary(self, ticks):
+
+        sums = {}
+        for tick_collisions in (item[2] for item in self.__history):
+            for handler, (calls, elapsed) in tick_collisions.items():
+                handler_sums = sums.get(handler)
+                if handler_sums is None:
+                    sums[handler] = [calls, elapsed]
+                else:
+                    handler_sums[0] += calls
+                    handler_sums[1] += elapsed
+
+        totals = self.__collision_totals
+
+        return {
+            handler: {
+                'calls': calls/ticks,
+                'time': elapsed/ticks,
+                'total_calls': totals[handler][0],
+                'total_time': totals[handler][1]
+            }
+            for handler, (calls, elapsed) in sums.items()
+        }
+
+    def __pairsSummary(self):
+
+        sums = {}
+        for tick_pairs in (item[3] for item in self.__history):
+            for pair, calls in tick_pairs.items():
+                sums[pair] = sums.get(pair, 0) + calls
+
+        top = heapq.nlargest(self.__top_pairs, sums.items(),
+                             key=lambda item: item[1])
+
+        return [
+            {
+                'handler': handler,
+                'first': PhaseStats.__ownerName(first),
+                'second': PhaseStats.__ownerName(second),
+                'calls': calls
+            }
+            for (handler, first, second), calls in top
+        ]
+
+    def summary(self):
+
+        history = self.__history
+        ticks = len(history)
+
+        if ticks == 0:
+            return {'ticks': self.__ticks, 'window': 0, 'phases': {},
+                    'collisions': {}, 'pairs': [],
+                    'totals': dict(self.__totals)}
+
+        times = PhaseStats.__average((item[0] for item in history), ticks)
+        entities = PhaseStats.__average((item[1] for item in history), ticks)
+
+        return {
+            'ticks': self.__ticks,
+            'window': ticks,
+            'phases': {
+                phase: {'time': elapsed, 'entities': entities.get(phase)}
+                for phase, elapsed in times.items()
+            },
+            'collisions': self.__collisionsSummary(ticks),
+            'pairs': self.__pairsSummary(),
+            'totals': dict(self.__totals)
+        }
+
+    @property
+    def window(self):
+        return self.__history.maxlen
+
+    @property
+    def ticks(self):
+        return self.__ticks
+
+    @property
+    def top_pairs(self):
+        return self.__top_pairs
@@ -0,0 +1,66 @@
+class TimerWheel:
+
+    def __init__(self, size=1024, tick=0):
+
+        self.__buckets = [{} for _ in range(size)]
+        self.__due_ticks = {}
+        self.__tick = tick
+
+    def schedule(self, item, due_tick):
+
+        self.cancel(item)
+
+        if due_tick <= self.__tick:
+            due_tick = self.__tick + 1
+
+        self.__due_ticks[item] = due_tick
+        self.__buckets[due_tick%len(self.__buckets)][item] = due_tick
+
+    def cancel(self, item):
+
+        due_tick = self.__due_ticks.pop(item, None)
+        if due_tick is None:
+            return False
+
+        del self.__buckets[due_tick%len(self.__buckets)][item]
+
+        return True
+
+    def dueTick(self, item):
+        return self.__due_ticks.get(item)
+
+    def advance(self, tick):
+
+        buckets = self.__buckets
+        size = len(buckets)
+
+        expired = []
+        ticks_count = min(tick - self.__tick, size)
+        for current_tick in range(tick - ticks_count + 1, tick + 1):
+
+            bucket = buckets[current_tick%size]
+            if not bucket:
+                continue
+
+            due_items = [item for item, due_tick in bucket.items()
+                         if due_tick <= tick]
+
+            for item in due_items:
+                del bucket[item]
+                del self.__due_ticks[item]
+
+            expired.extend(due_items)
+
+        self.__tick = tick
+
+        return expired
+
+    @property
+    def tick(self):
+        return self.__tick
+
+    def __contains__(self, item):
+        return item in self.__due_ticks
+
+    def __len__(self):
+        return len(self.__due_ticks)
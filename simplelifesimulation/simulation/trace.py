@@ -0,0 +1,136 @@
+import json
+import time
+import os
+
+class Tracer:
+
+    DEFAULT_BUFFER_SIZE = 1000
+    DEFAULT_BURST_SIZE = 5
+
+    def __init__(self, filename, buffer_size=DEFAULT_BUFFER_SIZE,
+                 burst_size=DEFAULT_BURST_SIZE, first_tick=1):
+
+        if buffer_size < 1:
+            raise ValueError('Trace buffer size must be at least 1')
+
+        self.__file = open(filename, 'w')
+        self.__file.write('[\n')
+        self.__separator = ''
+
+        self.__buffer = []
+        self.__buffer_size = buffer_size
+        self.__burst_size = burst_size
+
+        self.__origin = time.perf_counter()
+        self.__pid = os.getpid()
+
+        self.__tick = first_tick
+        self.__tick_start = None
+
+        self.stats = None
+
+        self.__emit({'name': 'process_name', 'ph': 'M', 'pid': self.__pid,
+                     'tid': 0, 'args': {'name': 'simulation'}})
+
+    def __timestamp(self, clock):
+        return (clock - self.__origin)*1e6
+
+    def __emit(self, event):
+
+        buffer = self.__buffer
+        buffer.append(event)
+
+        if len(buffer) >= self.__buffer_size:
+            self.flush()
+
+    @staticmethod
+    def clock():
+        return time.perf_counter()
+
+    def span(self, name, start, args=None):
+
+        end = time.perf_counter()
+
+        event = {'name': name, 'ph': 'X', 'pid': self.__pid, 'tid': 0,
+                 'ts': self.__timestamp(start), 'dur': (end - start)*1e6}
+        if args is not None:
+            event['args'] = args
+
+        self.__emit(event)
+
+    def instant(self, name, args=None):
+
+        event = {'name': name, 'ph': 'i', 's': 'p', 'pid': self.__pid,
+                 'tid': 0, 'ts': self.__timestamp(time.perf_counter())}
+        if args is not None:
+            event['args'] = args
+
+        self.__emit(event)
+
+    def counter(self, name, values):
+        self.__emit({'name': name, 'ph': 'C', 'pid': self.__pid, 'tid': 0,
+                     'ts': self.__timestamp(time.perf_counter()),
+                     'args': values})
+
+    def record(self, phase, start, entities=None):
+
+        if self.__tick_start is None:
+            self.__tick_start = start
+
+        self.span(phase, start,
+                  None if entities is None else {'entities': entities})
+
+        if self.stats is not None:
+            self.stats.record(phase, start, entities)
+
+    def population(self, creatures, plants, meats, births, deaths):
+
+        self.counter('population', {'creatures': creatures,
+                                    'plants': plants, 'meats': meats})
+
+        if births >= self.__burst_size:
+            self.instant('birth_burst', {'tick': self.__tick,
+                                         'births': births})
+
+        if deaths >= self.__burst_size:
+            self.instant('mass_death', {'tick': self.__tick,
+                                        'deaths': deaths})
+
+    def endTick(self):
+
+        if self.__tick_start is not None:
+            self.span('tick', self.__tick_start, {'tick': self.__tick})
+            self.__tick_start = None
+
+        self.__tick += 1
+
+        if self.stats is not None:
+            self.stats.endTick()
+
+    def flush(self):
+
+        buffer = self.__buffer
+        if not buffer:
+            return
+
+        file = self.__file
+        for event in buffer:
+            file.write(self.__separator)
+            file.write(json.dumps(event))
+            self.__separator = ',\n'
+
+        file.flush()
+        buffer.clear()
+
+    def close(self):
+
+        if self.__file.closed:
+            return
+
+        self.flush()
+        self.__file.write('\n]\n')
+        self.__file.close()
+
+    @property
+    def tick(self):
+        return self.__tick
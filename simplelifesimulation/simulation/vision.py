@@ -0,0 +1,236 @@
+from abc import ABC, abstractmethod
+from math import pi
+
+import numpy
+
+from .spatialhash import SpatialHash
+
+class EventVision:
+
+    def __init__(self, sensing_period=1):
+
+        self.__sensing_period = sensing_period
+        self.__pending = {}
+
+    def record(self, creature, target, target_is_creature):
+
+        pending = self.__pending.get(creature)
+        if pending is None:
+            pending = self.__pending[creature] = {}
+
+        pending[target] = target_is_creature
+
+    def sense(self, _creatures, _resources, tick=0, ghost_creatures=()):
+
+        sensing_period = self.__sensing_period
+
+        for creature in tuple(self.__pending):
+
+            if (creature.id_ + tick)%sensing_period != 0 and \
+                    not creature.destroyed:
+                continue
+
+            pending = self.__pending.pop(creature)
+            if creature.destroyed:
+                continue
+
+            creatures = []
+            resources = []
+            for target, target_is_creature in pending.items():
+                if not target.destroyed:
+                    (creatures if target_is_creature else resources).append(
+                        target)
+
+            if creatures or resources:
+                creature.visionAlerts(creatures, resources)
+
+    @property
+    def sensing_period(self):
+        return self.__sensing_period
+
+class ConeVision(ABC):
+
+    def __init__(self, sensing_period=1):
+
+        self.__sensing_period = sensing_period
+        self.__serials = {}
+        self.__next_serial = 0
+        self.__seen = numpy.empty(0, dtype=numpy.int64)
+
+    @abstractmethod
+    def _candidates(self, serials, positions, radii, ranges, sensing):
+        pass
+
+    def serial(self, entity):
+
+        serial = self.__serials.get(entity)
+        if serial is None:
+            serial = self.__serials[entity] = self.__next_serial
+            self.__next_serial += 1
+
+        return serial
+
+    @property
+    def sensing_period(self):
+        return self.__sensing_period
+
+    def sense(self, creatures, resources, tick=0, ghost_creatures=()):
+
+        creatures = tuple(creatures)
+        targets = creatures + tuple(ghost_creatures) + tuple(resources)
+
+        self.__serials = {target: self.serial(target) for target in targets}
+
+        if not creatures:
+            self.__seen = numpy.empty(0, dtype=numpy.int64)
+            return
+
+        serials = numpy.fromiter(self.__serials.values(), dtype=numpy.int64,
+                                 count=len(targets))
+
+        creatures_qtd = len(creatures)
+        targets_creatures_qtd = creatures_qtd + len(ghost_creatures)
+
+        if self.__sensing_period > 1:
+            sensing = (numpy.fromiter(
+                (creature.id_ for creature in creatures), dtype=numpy.int64,
+                count=creatures_qtd) + tick)%self.__sensing_period == 0
+
+            kept_seen = self.__seen[numpy.isin(
+                self.__seen >> 32, serials[:creatures_qtd][~sensing])]
+
+            if not sensing.any():
+                self.__seen = kept_seen
+                return
+        else:
+            sensing = numpy.ones(creatures_qtd, dtype=bool)
+            kept_seen = numpy.empty(0, dtype=numpy.int64)
+
+        positions = numpy.array(
+            [tuple(target.body.position) for target in targets], dtype=float)
+        radii = numpy.array(
+            [target.shape.radius for target in targets], dtype=float)
+
+        ranges = numpy.array(
+            [creature.currentvisiondistance for creature in creatures],
+            dtype=float)
+        half_angles = numpy.array(
+            [creature.currentvisionangle/2 for creature in creatures],
+            dtype=float)
+        directions = numpy.array(
+            [creature.body.angle for creature in creatures], dtype=float)
+
+        viewers, target_ids = self._candidates(
+            serials, positions, radii, ranges, sensing)
+
+        delta = positions[target_ids] - positions[viewers]
+        distance = numpy.hypot(delta[:, 0], delta[:, 1])
+        target_radii = radii[target_ids]
+
+        in_range = numpy.flatnonzero(
+            (viewers != target_ids) &
+            (distance <= ranges[viewers] + target_radii))
+
+        viewers = viewers[in_range]
+        target_ids = target_ids[in_range]
+        delta = delta[in_range]
+        distance = distance[in_range]
+        target_radii = target_radii[in_range]
+
+        angle = numpy.arctan2(delta[:, 1], delta[:, 0]) - directions[viewers]
+        angle = (angle + pi)%(2*pi) - pi
+        spread = numpy.arcsin(numpy.clip(
+            target_radii/numpy.maximum(distance, 1e-9), 0, 1))
+
+        visible = (numpy.abs(angle) <= half_angles[viewers] + spread) | \
+            (distance <= target_radii)
+
+        viewers = viewers[visible]
+        target_ids = target_ids[visible]
+
+        seen = serials[viewers] << 32 | serials[target_ids]
+        new_sights = numpy.flatnonzero(~numpy.isin(seen, self.__seen))
+
+        self.__seen = numpy.concatenate((kept_seen, seen))
+
+        sightings = {}
+        for viewer_id, target_id in zip(viewers[new_sights].tolist(),
+                                        target_ids[new_sights].tolist()):
+
+            viewer_sightings = sightings.get(viewer_id)
+            if viewer_sightings is None:
+                viewer_sightings = sightings[viewer_id] = ([], [])
+
+            viewer_sightings[target_id >= targets_creatures_qtd].append(
+                targets[target_id])
+
+        for viewer_id, (seen_creatures, seen_resources) in sightings.items():
+            creatures[viewer_id].visionAlerts(seen_creatures, seen_resources)
+
+class GridVision(ConeVision):
+
+    def __init__(self, sensing_period=1,
+                 cell_size=SpatialHash.DEFAULT_CELL_SIZE):
+        super().__init__(sensing_period)
+
+        self.__hash = SpatialHash(cell_size)
+
+    def _candidates(self, serials, positions, radii, ranges, sensing):
+
+        spatial_hash = self.__hash
+        spatial_hash.rebuild(positions)
+
+        sensing_ids = numpy.flatnonzero(sensing)
+
+        viewers, target_ids = spatial_hash.queryMany(
+            positions[sensing_ids, 0], positions[sensing_ids, 1],
+            ranges[sensing_ids] + radii.max())
+
+        return sensing_ids[viewers], target_ids
+
+    @property
+    def cell_size(self):
+        return self.__hash.cell_size
+
+class ContactVision(ConeVision):
+
+    SERIAL_MASK = 0xffffffff
+
+    def __init__(self, sensing_period=1):
+        super().__init__(sensing_period)
+
+        self.__contacts = set()
+
+    def touch(self, creature, target):
+        self.__contacts.add(self.serial(creature) << 32 | self.serial(target))
+
+    def lose(self, creature, target):
+        self.__contacts.discard(
+            self.serial(creature) << 32 | self.serial(target))
+
+    def _candidates(self, serials, positions, radii, ranges, sensing):
+
+        contacts = numpy.fromiter(self.__contacts, dtype=numpy.int64,
+                                  count=len(self.__contacts))
+        viewer_serials = contacts >> 32
+        target_serials = contacts & ContactVision.SERIAL_MASK
+
+        order = numpy.argsort(serials)
+        sorted_serials = serials[order]
+        last = len(serials) - 1
+
+        viewers = numpy.minimum(
+            numpy.searchsorted(sorted_serials, viewer_serials), last)
+        target_ids = numpy.minimum(
+            numpy.searchsorted(sorted_serials, target_serials), last)
+
+        valid = (sorted_serials[viewers] == viewer_serials) & \
+            (sorted_serials[target_ids] == target_serials)
+
+        viewers = order[viewers[valid]]
+        target_ids = order[target_ids[valid]]
+
+        viewers_sensing = viewers < len(ranges)
+        viewers_sensing[viewers_sensing] = sensing[viewers[viewers_sensing]]
+
+        return viewers[viewers_sensing], target_ids[viewers_sensing]